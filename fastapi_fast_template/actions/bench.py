@@ -0,0 +1,376 @@
+import asyncio
+import itertools
+import json
+import math
+import os
+import socket
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser, Namespace
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+from termcolor import colored
+
+from fastapi_fast_template.actions.base import ActionABC, ActionParserABC
+from fastapi_fast_template.utils.enums import DirectoryEnum
+from fastapi_fast_template.utils.helpers import get_app_config
+
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, math.inf)
+PERCENTILES = (50, 95, 99)
+DEFAULT_ROUTE = "/openapi.json"
+
+
+def get_percentile(latencies: list[float], percentile: int) -> float:
+    """
+    Nearest-rank percentile of sorted latencies.
+    """
+    if not latencies:
+        return 0.0
+    rank = math.ceil(percentile / 100 * len(latencies))
+    return latencies[max(rank, 1) - 1]
+
+
+def get_histogram(latencies: list[float]) -> list[list]:
+    counts = Counter()
+    for latency in latencies:
+        for bucket in HISTOGRAM_BUCKETS_MS:
+            if latency * 1000 <= bucket:
+                counts[bucket] += 1
+                break
+    return [
+        [None if math.isinf(bucket) else bucket, counts[bucket]]
+        for bucket in HISTOGRAM_BUCKETS_MS
+    ]
+
+
+def get_stats(
+    latencies: list[float], errors: int, statuses: Counter, elapsed: float
+) -> dict:
+    latencies = sorted(latencies)
+    stats = {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "statuses": {str(code): count for code, count in statuses.items()},
+        "histogram": get_histogram(latencies),
+    }
+    for percentile in PERCENTILES:
+        stats[f"p{percentile}"] = get_percentile(latencies, percentile)
+    stats["max"] = latencies[-1] if latencies else 0.0
+    return stats
+
+
+class BenchAction(ActionABC):
+    def perform_action(self, args: ArgumentParser):
+        if args.compare:
+            self.compare(*args.compare)
+            return
+
+        if args.url is None and get_app_config() is None:
+            print("Run this command in the root of a project created by fast.")
+            return
+
+        routes = [
+            self.parse_route(route) for route in args.route or [DEFAULT_ROUTE]
+        ]
+        server = None
+        url = args.url
+        if url is None:
+            port = self.get_free_port()
+            url = f"http://127.0.0.1:{port}"
+            server = self.start_server(port, args.workers)
+        try:
+            self.wait_until_ready(url, server)
+            result = asyncio.run(
+                self.run_load(
+                    url=url,
+                    routes=routes,
+                    concurrency=args.concurrency,
+                    duration=args.duration,
+                    requests=args.requests,
+                )
+            )
+        except RuntimeError as exc:
+            print(colored(str(exc), color="red"))
+            return
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+        self.print_result(result)
+        self.save_result(result, args.output)
+
+    def parse_route(self, route: str) -> tuple[str, str]:
+        method, _, path = route.strip().rpartition(" ")
+        return (method or "GET").upper(), path
+
+    def get_free_port(self) -> int:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def start_server(self, port: int, workers: int) -> subprocess.Popen:
+        command = [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--app-dir",
+            "src",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ]
+        if os.path.exists(".env"):
+            command.extend(["--env-file", ".env"])
+        return subprocess.Popen(command)
+
+    def wait_until_ready(
+        self,
+        url: str,
+        server: subprocess.Popen | None,
+        timeout: float = 30.0,
+    ) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if server is not None and server.poll() is not None:
+                raise RuntimeError("The application exited during startup.")
+            try:
+                httpx.get(url, timeout=1.0)
+                return
+            except httpx.TransportError:
+                time.sleep(0.2)
+        raise RuntimeError(f"{url} did not respond within {timeout} seconds.")
+
+    async def run_load(
+        self,
+        url: str,
+        routes: list[tuple[str, str]],
+        concurrency: int,
+        duration: float,
+        requests: int | None,
+    ) -> dict:
+        latencies = defaultdict(list)
+        errors = Counter()
+        statuses = defaultdict(Counter)
+        counter = itertools.count()
+        limits = httpx.Limits(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+        )
+
+        async with httpx.AsyncClient(
+            base_url=url, limits=limits, timeout=30.0
+        ) as client:
+            # Opens the connections and warms the application up before
+            # anything is measured.
+            await asyncio.gather(
+                *(
+                    client.request(method, path)
+                    for method, path in routes * concurrency
+                ),
+                return_exceptions=True,
+            )
+
+            async def worker() -> None:
+                while True:
+                    number = next(counter)
+                    if requests is not None and number >= requests:
+                        return
+                    if requests is None and time.perf_counter() >= deadline:
+                        return
+                    method, path = routes[number % len(routes)]
+                    name = f"{method} {path}"
+                    start = time.perf_counter()
+                    try:
+                        response = await client.request(method, path)
+                    except httpx.HTTPError:
+                        errors[name] += 1
+                        continue
+                    latencies[name].append(time.perf_counter() - start)
+                    statuses[name][response.status_code] += 1
+                    if response.status_code >= 500:
+                        errors[name] += 1
+
+            started = time.perf_counter()
+            deadline = started + duration
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+
+        names = [f"{method} {path}" for method, path in routes]
+        return {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "url": url,
+            "concurrency": concurrency,
+            "elapsed": elapsed,
+            "routes": {
+                name: get_stats(
+                    latencies[name], errors[name], statuses[name], elapsed
+                )
+                for name in names
+            },
+            "total": get_stats(
+                list(itertools.chain.from_iterable(latencies.values())),
+                sum(errors.values()),
+                sum(statuses.values(), Counter()),
+                elapsed,
+            ),
+        }
+
+    def print_result(self, result: dict) -> None:
+        print(
+            f"\n\t{result['total']['requests']} requests in "
+            f"{result['elapsed']:.1f}s, concurrency {result['concurrency']}"
+        )
+        print("\t___________________________________\n")
+        rows = {**result["routes"], "Total": result["total"]}
+        for name, stats in rows.items():
+            print(colored(f"\t{name}", color="green"))
+            print(
+                f"\t  RPS {stats['rps']:.1f}  errors {stats['errors']}  "
+                f"statuses {stats['statuses']}"
+            )
+            print(
+                "\t  "
+                + "  ".join(
+                    f"p{percentile} {stats[f'p{percentile}'] * 1000:.2f}ms"
+                    for percentile in PERCENTILES
+                )
+                + f"  max {stats['max'] * 1000:.2f}ms"
+            )
+
+        print(colored("\n\tLatency histogram (total)", color="green"))
+        largest = max(count for _, count in result["total"]["histogram"])
+        for bucket, count in result["total"]["histogram"]:
+            label = "> 1000ms" if bucket is None else f"<= {bucket}ms"
+            bar = "#" * round(40 * count / largest) if largest else ""
+            print(f"\t  {label:>9} {count:>8} {bar}")
+
+    def save_result(self, result: dict, output: str | None) -> None:
+        if output is None:
+            name = datetime.now().strftime("%Y%m%d-%H%M%S")
+            output = f"{DirectoryEnum.BENCH_RESULTS}/{name}.json"
+        path = Path(output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(result, indent=2))
+        print(f"\n\tSaved to {path}, compare runs with: fast bench -cmp A B")
+
+    def compare(self, base_path: str, new_path: str) -> None:
+        base = json.loads(Path(base_path).read_text())
+        new = json.loads(Path(new_path).read_text())
+        print(f"\n\t{base_path} -> {new_path}")
+        print("\t___________________________________\n")
+        names = [name for name in new["routes"] if name in base["routes"]]
+        metrics = [
+            "rps",
+            *(f"p{percentile}" for percentile in PERCENTILES),
+            "max",
+        ]
+        for name in [*names, "Total"]:
+            if name == "Total":
+                base_stats, new_stats = base["total"], new["total"]
+            else:
+                base_stats = base["routes"][name]
+                new_stats = new["routes"][name]
+            print(colored(f"\t{name}", color="green"))
+            for metric in metrics:
+                print(
+                    "\t  "
+                    + self.get_change(
+                        metric, base_stats[metric], new_stats[metric]
+                    )
+                )
+
+    def get_change(self, metric: str, before: float, after: float) -> str:
+        change = (after - before) / before * 100 if before else 0.0
+        # More requests per second is better, lower latencies are better.
+        improved = change > 0 if metric == "rps" else change < 0
+        if metric == "rps":
+            values = f"{before:.1f} -> {after:.1f}"
+        else:
+            values = f"{before * 1000:.2f}ms -> {after * 1000:.2f}ms"
+        color = "green" if improved else "red"
+        if abs(change) < 1:
+            color = "white"
+        return f"{metric:<4} {values:<28} " + colored(
+            f"{change:+.1f}%", color=color
+        )
+
+
+class BenchActionParser(ActionParserABC):
+    def parser(self):
+        bench = self.sub_parsers.add_parser(
+            "bench", help="Load test the routes of the application."
+        )
+        self.add_arguments(bench)
+        bench.set_defaults(func=self.action_class.perform_action)
+
+    def add_arguments(self, sub_parser):
+        sub_parser.add_argument(
+            "-r",
+            "--route",
+            action="append",
+            default=None,
+            help='Route to load, as "/path" or "METHOD /path", can be repeated '
+            f"(default: {DEFAULT_ROUTE})",
+        )
+        sub_parser.add_argument(
+            "-c",
+            "--concurrency",
+            type=int,
+            default=50,
+            help="Number of concurrent connections",
+        )
+        sub_parser.add_argument(
+            "-d",
+            "--duration",
+            type=float,
+            default=10.0,
+            help="Duration of the run in seconds",
+        )
+        sub_parser.add_argument(
+            "-n",
+            "--requests",
+            type=int,
+            default=None,
+            help="Total number of requests, overrides the duration",
+        )
+        sub_parser.add_argument(
+            "-w",
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of uvicorn workers the application is started with",
+        )
+        sub_parser.add_argument(
+            "-u",
+            "--url",
+            default=None,
+            help="Load an application that is already running instead",
+        )
+        sub_parser.add_argument(
+            "-o",
+            "--output",
+            default=None,
+            help=f"Result file (default: {DirectoryEnum.BENCH_RESULTS}/<date>.json)",
+        )
+        sub_parser.add_argument(
+            "-cmp",
+            "--compare",
+            nargs=2,
+            metavar=("BASE", "NEW"),
+            default=None,
+            help="Compare two result files instead of running",
+        )
+
+    def get_user_input(self, args: Namespace) -> None:
+        raise NotImplementedError
@@ -0,0 +1,76 @@
+import os
+from argparse import ArgumentParser, Namespace
+
+from fastapi_fast_template.actions.base import ActionABC, ActionParserABC
+from fastapi_fast_template.content import DbContent
+from fastapi_fast_template.utils.enums import DbCommandEnum, FileEnum
+from fastapi_fast_template.utils.helpers import (
+    FileBuilder,
+    add_line_to_last_import,
+    add_new_line,
+    add_text_to_obj_end,
+    check_extension_exists,
+    get_app_config,
+)
+
+
+class DbAction(ActionABC):
+    def perform_action(self, args: ArgumentParser):
+        if get_app_config() is None:
+            print("Run this command in the root of a project created by fast.")
+            return
+
+        if args.command == DbCommandEnum.INDEXES:
+            self.indexes(args)
+
+    def indexes(self, args: ArgumentParser) -> None:
+        if not check_extension_exists("indexes"):
+            self.add_index_check(args)
+        os.system("cd src && python -m utils.indexes")
+
+    def add_index_check(self, args: ArgumentParser) -> None:
+        db_content = DbContent(args)
+
+        FileBuilder(
+            file=FileEnum.SRC_UTILS_INDEX_USAGE,
+            build_function=db_content.get_index_usage,
+        ).build()
+        FileBuilder(
+            file=FileEnum.SRC_UTILS_INDEXES,
+            build_function=db_content.get_indexes,
+        ).build()
+        add_new_line(
+            file_path=FileEnum.FAST_TEMPLATE_INIT,
+            search_value="indexes",
+            remove_matched=True,
+            new_line=db_content.get_indexes_in_fast_template_init(),
+        )
+        add_line_to_last_import(
+            FileEnum.SRC_UTILS_LIFESPAN,
+            new_line=db_content.get_indexes_in_lifespan_import(),
+        )
+        add_text_to_obj_end(
+            FileEnum.SRC_UTILS_LIFESPAN,
+            async_function_name="start_application",
+            text_to_add=db_content.get_indexes_in_lifespan_start_application(),
+        )
+
+
+class DbActionParser(ActionParserABC):
+    def parser(self):
+        db = self.sub_parsers.add_parser(
+            "db", help="Inspect the database of the project."
+        )
+        self.add_arguments(db)
+        db.set_defaults(func=self.action_class.perform_action)
+
+    def add_arguments(self, sub_parser):
+        sub_parser.add_argument(
+            "command",
+            choices=DbCommandEnum.get_values(),
+            help="indexes: report missing indexes and print the DDL to "
+            "create them",
+        )
+
+    def get_user_input(self, args: Namespace) -> None:
+        raise NotImplementedError
@@ -20,6 +20,7 @@ from fastapi_fast_template.utils.helpers import (
     add_text_to_obj_end,
     check_extension_exists,
     create_directory,
+    find_line_in_file,
 )
 
 
@@ -37,6 +38,22 @@ class ExtensionAction(ActionABC):
             self.stream(args)
         elif args.name == ExtensionNameEnum.AUTH:
             self.auth(args)
+        elif args.name == ExtensionNameEnum.LOOP_MONITOR:
+            self.loop_monitor(args)
+        elif args.name == ExtensionNameEnum.DIAGNOSTICS:
+            self.diagnostics(args)
+        elif args.name == ExtensionNameEnum.ADMISSION:
+            self.admission(args)
+        elif args.name == ExtensionNameEnum.COALESCING:
+            self.coalescing(args)
+        elif args.name == ExtensionNameEnum.ETAG:
+            self.etag(args)
+        elif args.name == ExtensionNameEnum.COMPRESSION:
+            self.compression(args)
+        elif args.name == ExtensionNameEnum.HTTP:
+            self.http(args)
+        elif args.name == ExtensionNameEnum.CIRCUIT_BREAKER:
+            self.circuit_breaker(args)
 
     def babel(self, args: ArgumentParser) -> None:
         os.system("pip install fastapi-and-babel")
@@ -192,6 +209,7 @@ class ExtensionAction(ActionABC):
         os.system(f"pip install faststream[{stream_brokers[args.broker]}]")
 
         ext_content = ExtensionContent(args)
+        ext_content.stream = args.broker
         FileBuilder(
             file=FileEnum.SRC_STREAM,
             build_function=ext_content.get_stream_in_stream,
@@ -211,6 +229,33 @@ class ExtensionAction(ActionABC):
             file_path=FileEnum.SRC_UTILS_LIFESPAN,
             new_line=ext_content.get_stream_in_lifespan(),
         )
+        FileBuilder(
+            file=FileEnum.SRC_UTILS_BUFFERED_PUBLISHER,
+            build_function=ext_content.get_stream_buffered_publisher,
+        ).build()
+        FileBuilder(
+            file=FileEnum.SRC_UTILS_PUBLISHER,
+            build_function=ext_content.get_stream_publisher,
+        ).build()
+        add_text_to_obj_end(
+            file_path=FileEnum.SRC_CONFIG,
+            class_name="Settings",
+            text_to_add=ext_content.get_stream_publisher_in_setting(),
+        )
+        add_line_to_last_import(
+            FileEnum.SRC_UTILS_LIFESPAN,
+            new_line=ext_content.get_stream_publisher_in_lifespan_import(),
+        )
+        add_text_to_obj_end(
+            FileEnum.SRC_UTILS_LIFESPAN,
+            async_function_name="start_application",
+            text_to_add=ext_content.get_stream_publisher_in_lifespan_start_application(),
+        )
+        add_text_to_obj_end(
+            FileEnum.SRC_UTILS_LIFESPAN,
+            async_function_name="down_application",
+            text_to_add=ext_content.get_stream_publisher_in_lifespan_down_application(),
+        )
 
     def auth(self, args: ArgumentParser):
         os.system("pip install authx")
@@ -232,6 +277,275 @@ class ExtensionAction(ActionABC):
             new_line=ext_content.get_authx_in_app(),
         )
 
+    def loop_monitor(self, args: ArgumentParser) -> None:
+        if check_extension_exists(ExtensionNameEnum.LOOP_MONITOR):
+            print("You have already added the loop monitor")
+            return
+
+        os.system("pip install prometheus-client")
+        ext_content = ExtensionContent(args)
+
+        FileBuilder(
+            file=FileEnum.SRC_UTILS_LOOP_MONITOR,
+            build_function=ext_content.get_loop_monitor,
+        ).build()
+        add_new_line(
+            file_path=FileEnum.FAST_TEMPLATE_INIT,
+            search_value="loop_monitor",
+            remove_matched=True,
+            new_line=ext_content.get_loop_monitor_in_fast_template_init(),
+        )
+        add_text_to_obj_end(
+            file_path=FileEnum.SRC_CONFIG,
+            class_name="Settings",
+            text_to_add=ext_content.get_loop_monitor_in_setting(),
+        )
+        add_line_to_last_import(
+            FileEnum.SRC_UTILS_LIFESPAN,
+            new_line=ext_content.get_loop_monitor_in_lifespan_import(),
+        )
+        add_text_to_obj_end(
+            FileEnum.SRC_UTILS_LIFESPAN,
+            async_function_name="start_application",
+            text_to_add=ext_content.get_loop_monitor_in_lifespan_start_application(),
+        )
+        add_text_to_obj_end(
+            FileEnum.SRC_UTILS_LIFESPAN,
+            async_function_name="down_application",
+            text_to_add=ext_content.get_loop_monitor_in_lifespan_down_application(),
+        )
+
+    def diagnostics(self, args: ArgumentParser) -> None:
+        if check_extension_exists(ExtensionNameEnum.DIAGNOSTICS):
+            print("You have already added the diagnostics")
+            return
+
+        ext_content = ExtensionContent(args)
+
+        FileBuilder(
+            file=FileEnum.SRC_ROUTERS_DIAGNOSTICS,
+            build_function=ext_content.get_diagnostics,
+        ).build()
+        add_new_line(
+            file_path=FileEnum.FAST_TEMPLATE_INIT,
+            search_value="diagnostics",
+            remove_matched=True,
+            new_line=ext_content.get_diagnostics_in_fast_template_init(),
+        )
+        add_text_to_obj_end(
+            file_path=FileEnum.SRC_CONFIG,
+            class_name="Settings",
+            text_to_add=ext_content.get_diagnostics_in_setting(),
+        )
+        add_line_to_last_import(
+            FileEnum.SRC_ROUTERS_INIT_,
+            new_line=ext_content.get_diagnostics_import_in_router(),
+        )
+        add_new_line(
+            file_path=FileEnum.SRC_ROUTERS_INIT_,
+            new_line=ext_content.get_diagnostics_in_router(),
+        )
+
+    def admission(self, args: ArgumentParser) -> None:
+        if check_extension_exists(ExtensionNameEnum.ADMISSION):
+            print("You have already added the admission control")
+            return
+
+        ext_content = ExtensionContent(args)
+
+        FileBuilder(
+            file=FileEnum.SRC_UTILS_ADMISSION,
+            build_function=ext_content.get_admission,
+        ).build()
+        add_new_line(
+            file_path=FileEnum.FAST_TEMPLATE_INIT,
+            search_value="admission",
+            remove_matched=True,
+            new_line=ext_content.get_admission_in_fast_template_init(),
+        )
+        add_text_to_obj_end(
+            file_path=FileEnum.SRC_CONFIG,
+            class_name="Settings",
+            text_to_add=ext_content.get_admission_in_setting(),
+        )
+        add_line_to_last_import(
+            FileEnum.SRC_APP,
+            new_line=ext_content.get_admission_import_in_app(),
+        )
+        add_new_line(
+            file_path=FileEnum.SRC_APP,
+            search_value="return app",
+            new_line=ext_content.get_admission_in_app(),
+        )
+
+    def coalescing(self, args: ArgumentParser) -> None:
+        if check_extension_exists(ExtensionNameEnum.COALESCING):
+            print("You have already added the request coalescing")
+            return
+
+        ext_content = ExtensionContent(args)
+
+        FileBuilder(
+            file=FileEnum.SRC_UTILS_COALESCING,
+            build_function=ext_content.get_coalescing,
+        ).build()
+        add_new_line(
+            file_path=FileEnum.FAST_TEMPLATE_INIT,
+            search_value="coalescing",
+            remove_matched=True,
+            new_line=ext_content.get_coalescing_in_fast_template_init(),
+        )
+        add_line_to_last_import(
+            FileEnum.SRC_APP,
+            new_line=ext_content.get_coalescing_import_in_app(),
+        )
+        add_new_line(
+            file_path=FileEnum.SRC_APP,
+            search_value="return app",
+            new_line=ext_content.get_coalescing_in_app(),
+        )
+
+    def etag(self, args: ArgumentParser) -> None:
+        if check_extension_exists(ExtensionNameEnum.ETAG):
+            print("You have already added the etag")
+            return
+
+        ext_content = ExtensionContent(args)
+
+        FileBuilder(
+            file=FileEnum.SRC_UTILS_ETAG,
+            build_function=ext_content.get_etag,
+        ).build()
+        add_new_line(
+            file_path=FileEnum.FAST_TEMPLATE_INIT,
+            search_value="etag",
+            remove_matched=True,
+            new_line=ext_content.get_etag_in_fast_template_init(),
+        )
+        add_text_to_obj_end(
+            file_path=FileEnum.SRC_CONFIG,
+            class_name="Settings",
+            text_to_add=ext_content.get_etag_in_setting(),
+        )
+        add_line_to_last_import(
+            FileEnum.SRC_APP,
+            new_line=ext_content.get_etag_import_in_app(),
+        )
+        add_new_line(
+            file_path=FileEnum.SRC_APP,
+            search_value="return app",
+            new_line=ext_content.get_etag_in_app(),
+        )
+
+    def compression(self, args: ArgumentParser) -> None:
+        if check_extension_exists(ExtensionNameEnum.COMPRESSION):
+            print("You have already added the compression")
+            return
+
+        ext_content = ExtensionContent(args)
+
+        FileBuilder(
+            file=FileEnum.SRC_UTILS_COMPRESSION,
+            build_function=ext_content.get_compression,
+        ).build()
+        add_new_line(
+            file_path=FileEnum.FAST_TEMPLATE_INIT,
+            search_value="compression",
+            remove_matched=True,
+            new_line=ext_content.get_compression_in_fast_template_init(),
+        )
+        add_text_to_obj_end(
+            file_path=FileEnum.SRC_CONFIG,
+            class_name="Settings",
+            text_to_add=ext_content.get_compression_in_setting(),
+        )
+        add_line_to_last_import(
+            FileEnum.SRC_APP,
+            new_line=ext_content.get_compression_import_in_app(),
+        )
+        add_new_line(
+            file_path=FileEnum.SRC_APP,
+            search_value="return app",
+            new_line=ext_content.get_compression_in_app(),
+        )
+
+    def http(self, args: ArgumentParser) -> None:
+        if check_extension_exists(ExtensionNameEnum.HTTP):
+            print("You have already added the http client")
+            return
+
+        os.system("pip install httpx[http2]")
+        ext_content = ExtensionContent(args)
+
+        FileBuilder(
+            file=FileEnum.SRC_UTILS_HTTP,
+            build_function=ext_content.get_http,
+        ).build()
+        add_new_line(
+            file_path=FileEnum.FAST_TEMPLATE_INIT,
+            search_value="http",
+            remove_matched=True,
+            new_line=ext_content.get_http_in_fast_template_init(),
+        )
+        add_text_to_obj_end(
+            file_path=FileEnum.SRC_CONFIG,
+            class_name="Settings",
+            text_to_add=ext_content.get_http_in_setting(),
+        )
+        add_line_to_last_import(
+            FileEnum.SRC_UTILS_LIFESPAN,
+            new_line=ext_content.get_http_in_lifespan_import(),
+        )
+        add_text_to_obj_end(
+            FileEnum.SRC_UTILS_LIFESPAN,
+            async_function_name="start_application",
+            text_to_add=ext_content.get_http_in_lifespan_start_application(),
+        )
+        add_text_to_obj_end(
+            FileEnum.SRC_UTILS_LIFESPAN,
+            async_function_name="down_application",
+            text_to_add=ext_content.get_http_in_lifespan_down_application(),
+        )
+
+    def circuit_breaker(self, args: ArgumentParser) -> None:
+        if check_extension_exists(ExtensionNameEnum.CIRCUIT_BREAKER):
+            print("You have already added the circuit breaker")
+            return
+
+        ext_content = ExtensionContent(args)
+
+        FileBuilder(
+            file=FileEnum.SRC_UTILS_CIRCUIT_BREAKER,
+            build_function=ext_content.get_circuit_breaker,
+        ).build()
+        add_new_line(
+            file_path=FileEnum.FAST_TEMPLATE_INIT,
+            search_value="circuit_breaker",
+            remove_matched=True,
+            new_line=ext_content.get_circuit_breaker_in_fast_template_init(),
+        )
+        add_text_to_obj_end(
+            file_path=FileEnum.SRC_CONFIG,
+            class_name="Settings",
+            text_to_add=ext_content.get_circuit_breaker_in_setting(),
+        )
+        # Repositories generated before REQUEST_ERRORS existed count every
+        # error as a database failure.
+        request_errors = (
+            find_line_in_file("REQUEST_ERRORS", FileEnum.SRC_REPO_BASE)
+            is not None
+        )
+        add_line_to_last_import(
+            FileEnum.SRC_REPO_BASE,
+            new_line=ext_content.get_circuit_breaker_import_in_repository(),
+        )
+        add_new_line(
+            file_path=FileEnum.SRC_REPO_BASE,
+            new_line=ext_content.get_circuit_breaker_in_repository(
+                request_errors
+            ),
+        )
+
 
 class ExtensionActionParser(ActionParserABC):
     def parser(self):
@@ -12,6 +12,7 @@ from fastapi_fast_template.utils.enums import (
     FileEnum,
     ODMEnum,
     ORMEnum,
+    YesNoEnum,
 )
 from fastapi_fast_template.utils.helpers import FileBuilder, create_directory
 
@@ -29,6 +30,8 @@ class InitAction(ActionABC):
     def init(self, args: ArgumentParser) -> None:
         self.create_initial_dirs()
         self.create_initial_files(args)
+        if args.benchmarks == YesNoEnum.YES:
+            self.create_benchmarks(args)
         print("Initializing has been done successfully.")
 
     def create_initial_dirs(self) -> None:
@@ -82,7 +85,14 @@ class InitAction(ActionABC):
             ),
             FileBuilder(file=".env"),
             # tests
-            FileBuilder(file="tests/conftest.py"),
+            FileBuilder(
+                file=FileEnum.PYTEST_INI,
+                build_function=self.root_content.get_pytest_ini,
+            ),
+            FileBuilder(
+                file=FileEnum.TESTS_CONFTEST,
+                build_function=self.root_content.get_conftest,
+            ),
             # src
             FileBuilder(
                 file=FileEnum.SRC_CONFIG,
@@ -117,6 +127,33 @@ class InitAction(ActionABC):
             file.build()
             print(f"File {file.file} has been created successfully.")
 
+    def create_benchmarks(self, args: ArgumentParser) -> None:
+        if args.orm_odm == ODMEnum.BEANIE:
+            print(
+                "The benchmarks are only available for SQLAlchemy, SQLModel and Tortoise."
+            )
+            return
+
+        create_directory(DirectoryEnum.BENCHMARKS)
+        benchmark_files = [
+            FileBuilder(file=FileEnum.BENCHMARKS_INIT_),
+            FileBuilder(
+                file=FileEnum.BENCHMARKS_PYTEST_INI,
+                build_function=self.root_content.get_benchmarks_pytest_ini,
+            ),
+            FileBuilder(
+                file=FileEnum.BENCHMARKS_CONFTEST,
+                build_function=self.root_content.get_benchmarks_conftest,
+            ),
+            FileBuilder(
+                file=FileEnum.BENCHMARKS_REPOSITORIES,
+                build_function=self.root_content.get_benchmarks_repositories,
+            ),
+        ]
+        for file in benchmark_files:
+            file.build()
+            print(f"File {file.file} has been created successfully.")
+
 
 class InitActionParser(ActionParserABC):
     def parser(self):
@@ -147,6 +184,13 @@ class InitActionParser(ActionParserABC):
             choices=ORMEnum.get_values(),
             help="ORM - ODM",
         )
+        sub_parser.add_argument(
+            "-bm",
+            "--benchmarks",
+            default=ArgumentDefaultValueEnum.BENCHMARKS,
+            choices=YesNoEnum.get_values(),
+            help="Generate the repository benchmarks",
+        )
 
     def get_user_input(self, args):
         args.app_name = self._get_input(
@@ -163,3 +207,8 @@ class InitActionParser(ActionParserABC):
             message=f"Enter the ORM/ODM (default: {ArgumentDefaultValueEnum.ORM_ODM}): ",
             choices=ORMEnum.get_values() + ODMEnum.get_values(),
         )
+        args.benchmarks = self._get_input(
+            default_value=args.benchmarks,
+            message=f"Generate the repository benchmarks (default: {ArgumentDefaultValueEnum.BENCHMARKS}): ",
+            choices=YesNoEnum.get_values(),
+        )
@@ -1,6 +1,11 @@
 import argparse
 import sys
 
+from fastapi_fast_template.actions.bench import (
+    BenchAction,
+    BenchActionParser,
+)
+from fastapi_fast_template.actions.db import DbAction, DbActionParser
 from fastapi_fast_template.actions.doc import DocAction, DocActionParser
 from fastapi_fast_template.actions.extension import (
     ExtensionAction,
@@ -25,6 +30,14 @@ class Cli:
             action_class=DocAction(),
             sub_parsers=self.sub_parsers,
         )
+        self.db_action_parser = DbActionParser(
+            action_class=DbAction(),
+            sub_parsers=self.sub_parsers,
+        )
+        self.bench_action_parser = BenchActionParser(
+            action_class=BenchAction(),
+            sub_parsers=self.sub_parsers,
+        )
 
     @classmethod
     def main(cls) -> None:
@@ -37,6 +50,8 @@ class Cli:
         instance.init_action_parser.parser()
         instance.extension_action_parser.parser()
         instance.doc_action_parser.parser()
+        instance.db_action_parser.parser()
+        instance.bench_action_parser.parser()
         instance.__parse_args(parser)
 
     def __parse_args(self, parser: argparse.ArgumentParser) -> None:
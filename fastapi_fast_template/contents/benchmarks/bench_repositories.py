@@ -0,0 +1,62 @@
+"""
+Micro-benchmarks of the BaseRepository methods at several table sizes.
+
+    pytest benchmarks --benchmark-save=baseline
+    pytest benchmarks --benchmark-compare=0001 --benchmark-compare-fail=mean:10%
+
+Results are stored as JSON in ".benchmarks/", the second command fails when
+a benchmark got more than 10% slower than the saved baseline.
+"""
+
+import pytest
+
+SIZES = (10, 100, 1_000)
+ROUNDS = 20
+
+
+@pytest.mark.parametrize("size", SIZES)
+def bench_get_by_id(benchmark, run, repository, seed, size):
+    item_id = seed(size)[size // 2].id
+    benchmark(lambda: run(repository.get_by_id(item_id)))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def bench_get_all(benchmark, run, repository, seed, size):
+    seed(size)
+    benchmark(lambda: run(repository.get_all(limit=size)))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def bench_filter_by(benchmark, run, repository, seed, size):
+    seed(size)
+    benchmark(lambda: run(repository.filter_by(category=3)))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def bench_bulk_create(benchmark, run, repository, new_items, size):
+    benchmark.pedantic(
+        lambda items: run(repository.bulk_create(items)),
+        setup=lambda: ((new_items(size),), {}),
+        rounds=ROUNDS,
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def bench_bulk_update(benchmark, run, repository, seed, size):
+    items = seed(size)
+
+    def bulk_update():
+        for item in items:
+            item.price += 1
+        run(repository.bulk_update(items))
+
+    benchmark(bulk_update)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def bench_bulk_delete(benchmark, run, repository, seed, size):
+    benchmark.pedantic(
+        lambda items: run(repository.bulk_delete(items)),
+        setup=lambda: ((seed(size),), {}),
+        rounds=ROUNDS,
+    )
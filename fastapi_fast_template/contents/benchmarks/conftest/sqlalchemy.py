@@ -0,0 +1,112 @@
+import asyncio
+import os
+import sys
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import String, delete
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import StaticPool
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from repositories.base import BaseRepository  # noqa: E402
+
+# An in-memory SQLite database by default, set BENCH_DB_URL to run against
+# a local PostgreSQL instead (e.g. postgresql+asyncpg://.../bench).
+BENCH_DB_URL = os.environ.get("BENCH_DB_URL", "sqlite+aiosqlite://")
+
+
+class BenchBase(DeclarativeBase):
+    pass
+
+
+class BenchItem(BenchBase):
+    __tablename__ = "bench_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    category: Mapped[int] = mapped_column(index=True)
+    price: Mapped[int]
+
+
+class BenchItemRepository(BaseRepository[BenchItem]):
+    model_class = BenchItem
+
+
+@pytest.fixture(scope="session")
+def runner() -> Generator[asyncio.Runner, None, None]:
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture(scope="session")
+def run(runner: asyncio.Runner) -> Callable:
+    """
+    Runs a repository call to completion, so the same benchmarks drive the
+    async and the sync repositories.
+    """
+    return runner.run
+
+
+@pytest.fixture(scope="session")
+def engine(runner: asyncio.Runner) -> Generator[AsyncEngine, None, None]:
+    engine = create_async_engine(BENCH_DB_URL, poolclass=StaticPool)
+
+    async def create_tables():
+        async with engine.begin() as connection:
+            await connection.run_sync(BenchBase.metadata.drop_all)
+            await connection.run_sync(BenchBase.metadata.create_all)
+
+    runner.run(create_tables())
+    yield engine
+    runner.run(engine.dispose())
+
+
+@pytest.fixture
+def session(
+    runner: asyncio.Runner, engine: AsyncEngine
+) -> Generator[AsyncSession, None, None]:
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    yield session
+
+    async def clean_up():
+        await session.execute(delete(BenchItem))
+        await session.commit()
+        await session.close()
+
+    runner.run(clean_up())
+
+
+@pytest.fixture
+def repository(session: AsyncSession) -> BenchItemRepository:
+    return BenchItemRepository(session)
+
+
+@pytest.fixture
+def new_items() -> Callable[[int], list[BenchItem]]:
+    def new_items(size: int) -> list[BenchItem]:
+        return [
+            BenchItem(name=f"item-{i}", category=i % 10, price=i)
+            for i in range(size)
+        ]
+
+    return new_items
+
+
+@pytest.fixture
+def seed(
+    run: Callable, repository: BenchItemRepository, new_items: Callable
+) -> Callable[[int], list[BenchItem]]:
+    def seed(size: int) -> list[BenchItem]:
+        return run(repository.bulk_create(new_items(size)))
+
+    return seed
@@ -0,0 +1,83 @@
+import os
+import sys
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, delete
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Field, Session, SQLModel, create_engine
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from repositories.base import BaseRepository  # noqa: E402
+
+# An in-memory SQLite database by default, set BENCH_DB_URL to run against
+# a local PostgreSQL instead (e.g. postgresql+psycopg://.../bench).
+BENCH_DB_URL = os.environ.get("BENCH_DB_URL", "sqlite://")
+
+
+class BenchItem(SQLModel, table=True):
+    __tablename__ = "bench_items"
+
+    id: int | None = Field(default=None, primary_key=True)
+    name: str = Field(max_length=50)
+    category: int = Field(index=True)
+    price: int
+
+
+class BenchItemRepository(BaseRepository[BenchItem]):
+    model_class = BenchItem
+
+
+@pytest.fixture(scope="session")
+def run() -> Callable:
+    """
+    Returns the result of a repository call as is, so the same benchmarks
+    drive the async and the sync repositories.
+    """
+    return lambda result: result
+
+
+@pytest.fixture(scope="session")
+def engine() -> Generator[Engine, None, None]:
+    engine = create_engine(BENCH_DB_URL, poolclass=StaticPool)
+    BenchItem.__table__.drop(engine, checkfirst=True)
+    BenchItem.__table__.create(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine: Engine) -> Generator[Session, None, None]:
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+        session.exec(delete(BenchItem))
+        session.commit()
+
+
+@pytest.fixture
+def repository(session: Session) -> BenchItemRepository:
+    return BenchItemRepository(session)
+
+
+@pytest.fixture
+def new_items() -> Callable[[int], list[BenchItem]]:
+    def new_items(size: int) -> list[BenchItem]:
+        return [
+            BenchItem(name=f"item-{i}", category=i % 10, price=i)
+            for i in range(size)
+        ]
+
+    return new_items
+
+
+@pytest.fixture
+def seed(
+    repository: BenchItemRepository, new_items: Callable
+) -> Callable[[int], list[BenchItem]]:
+    def seed(size: int) -> list[BenchItem]:
+        return repository.bulk_create(new_items(size))
+
+    return seed
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import sys
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+from tortoise import Tortoise, fields
+from tortoise.models import Model
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from repositories.base import BaseRepository  # noqa: E402
+
+# An in-memory SQLite database by default, set BENCH_DB_URL to run against
+# a local PostgreSQL instead (e.g. postgres://.../bench).
+BENCH_DB_URL = os.environ.get("BENCH_DB_URL", "sqlite://:memory:")
+
+
+class BenchItem(Model):
+    id = fields.IntField(primary_key=True)
+    name = fields.CharField(max_length=50)
+    category = fields.IntField(db_index=True)
+    price = fields.IntField()
+
+    class Meta:
+        table = "bench_items"
+
+
+class BenchItemRepository(BaseRepository[BenchItem]):
+    model_class = BenchItem
+
+
+@pytest.fixture(scope="session")
+def runner() -> Generator[asyncio.Runner, None, None]:
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture(scope="session")
+def run(runner: asyncio.Runner) -> Callable:
+    """
+    Runs a repository call to completion, so the same benchmarks drive the
+    async and the sync repositories.
+    """
+    return runner.run
+
+
+@pytest.fixture(scope="session")
+def database(runner: asyncio.Runner) -> Generator[None, None, None]:
+    async def init():
+        await Tortoise.init(
+            db_url=BENCH_DB_URL, modules={"models": [__name__]}
+        )
+        await Tortoise.generate_schemas()
+
+    runner.run(init())
+    yield
+    runner.run(Tortoise.close_connections())
+
+
+@pytest.fixture
+def repository(
+    runner: asyncio.Runner, database: None
+) -> Generator[BenchItemRepository, None, None]:
+    yield BenchItemRepository()
+
+    async def clean_up():
+        await BenchItem.all().delete()
+
+    runner.run(clean_up())
+
+
+@pytest.fixture
+def new_items() -> Callable[[int], list[BenchItem]]:
+    def new_items(size: int) -> list[BenchItem]:
+        return [
+            BenchItem(name=f"item-{i}", category=i % 10, price=i)
+            for i in range(size)
+        ]
+
+    return new_items
+
+
+@pytest.fixture
+def seed(
+    run: Callable, repository: BenchItemRepository, new_items: Callable
+) -> Callable[[int], list[BenchItem]]:
+    async def create(size: int) -> list[BenchItem]:
+        # bulk_create does not fetch the primary keys back on every database.
+        last = await BenchItem.all().order_by("-id").first()
+        await repository.bulk_create(new_items(size))
+        return await BenchItem.filter(id__gt=last.id if last else 0)
+
+    def seed(size: int) -> list[BenchItem]:
+        return run(create(size))
+
+    return seed
@@ -0,0 +1,39 @@
+from config import settings
+from faststream import AckPolicy, FastStream, Logger
+from faststream.kafka import KafkaBroker
+
+from utils.lifespan import stream_lifespan
+
+broker = KafkaBroker(settings.broker_url)
+app = FastStream(
+    broker,
+    lifespan=stream_lifespan,
+)
+
+
+# Handles up to `stream_max_workers` messages at the same time. With an ack
+# policy other than ack_first the messages are spread over the workers by
+# partition, so the order within a partition is kept.
+@broker.subscriber(
+    "test",
+    group_id=settings.stream_group_id,
+    max_workers=settings.stream_max_workers,
+    max_poll_records=settings.stream_prefetch_count,
+    ack_policy=AckPolicy(settings.stream_ack_policy),
+)
+async def handle() -> str:
+    return "Hi!"
+
+
+# Receives up to `stream_batch_max_records` messages in one call, or the ones
+# that arrived within `stream_batch_max_wait_ms`.
+@broker.subscriber(
+    "test-batch",
+    group_id=settings.stream_group_id,
+    batch=True,
+    max_records=settings.stream_batch_max_records,
+    batch_timeout_ms=settings.stream_batch_max_wait_ms,
+    ack_policy=AckPolicy(settings.stream_ack_policy),
+)
+async def handle_batch(messages: list[str], logger: Logger) -> None:
+    logger.info(f"Received {len(messages)} messages")
@@ -0,0 +1,37 @@
+from config import settings
+from faststream import AckPolicy, FastStream, Logger
+from faststream.confluent import KafkaBroker
+
+from utils.lifespan import stream_lifespan
+
+broker = KafkaBroker(settings.broker_url)
+app = FastStream(
+    broker,
+    lifespan=stream_lifespan,
+)
+
+
+# Handles up to `stream_max_workers` messages at the same time, which needs
+# the ack_first ack policy.
+@broker.subscriber(
+    "test",
+    group_id=settings.stream_group_id,
+    max_workers=settings.stream_max_workers,
+    ack_policy=AckPolicy(settings.stream_ack_policy),
+)
+async def handle() -> str:
+    return "Hi!"
+
+
+# Receives up to `stream_batch_max_records` messages in one call, or the ones
+# that arrived within `stream_batch_max_wait_ms`.
+@broker.subscriber(
+    "test-batch",
+    group_id=settings.stream_group_id,
+    batch=True,
+    max_records=settings.stream_batch_max_records,
+    polling_interval=settings.stream_batch_max_wait_ms / 1000,
+    ack_policy=AckPolicy(settings.stream_ack_policy),
+)
+async def handle_batch(messages: list[str], logger: Logger) -> None:
+    logger.info(f"Received {len(messages)} messages")
@@ -0,0 +1,42 @@
+from config import settings
+from faststream import AckPolicy, FastStream, Logger
+from faststream.nats import JStream, NatsBroker, PullSub
+
+from utils.buffered_publisher import decompress
+from utils.lifespan import stream_lifespan
+
+broker = NatsBroker(settings.broker_url)
+app = FastStream(
+    broker,
+    lifespan=stream_lifespan,
+)
+
+
+# Handles up to `stream_max_workers` messages at the same time and buffers
+# up to `stream_prefetch_count` messages for them. `decompress` decodes the
+# messages the buffered publisher compressed.
+@broker.subscriber(
+    "test",
+    max_workers=settings.stream_max_workers,
+    pending_msgs_limit=settings.stream_prefetch_count,
+    decoder=decompress,
+)
+async def handle() -> str:
+    return "Hi!"
+
+
+# Pulls up to `stream_batch_max_records` messages of the JetStream stream in
+# one call, or the ones that arrived within `stream_batch_max_wait_ms`.
+@broker.subscriber(
+    "test-batch",
+    stream=JStream("test"),
+    durable="test-batch",
+    pull_sub=PullSub(
+        batch_size=settings.stream_batch_max_records,
+        timeout=settings.stream_batch_max_wait_ms / 1000,
+        batch=True,
+    ),
+    ack_policy=AckPolicy(settings.stream_ack_policy),
+)
+async def handle_batch(messages: list[str], logger: Logger) -> None:
+    logger.info(f"Received {len(messages)} messages")
@@ -0,0 +1,26 @@
+from config import settings
+from faststream import AckPolicy, FastStream
+from faststream.rabbit import Channel, RabbitBroker
+
+from utils.buffered_publisher import decompress
+from utils.lifespan import stream_lifespan
+
+broker = RabbitBroker(settings.broker_url)
+app = FastStream(
+    broker,
+    lifespan=stream_lifespan,
+)
+
+
+# Every delivery is handled in its own task, so the prefetch count is the
+# number of messages handled at the same time. RabbitMQ has no batch
+# consumers, messages are delivered one by one. `decompress` decodes the
+# messages the buffered publisher compressed.
+@broker.subscriber(
+    "test",
+    channel=Channel(prefetch_count=settings.stream_prefetch_count),
+    ack_policy=AckPolicy(settings.stream_ack_policy),
+    decoder=decompress,
+)
+async def handle() -> str:
+    return "Hi!"
@@ -0,0 +1,37 @@
+from config import settings
+from faststream import FastStream, Logger
+from faststream.redis import ListSub, RedisBroker
+
+from utils.buffered_publisher import decompress
+from utils.lifespan import stream_lifespan
+
+broker = RedisBroker(settings.broker_url)
+app = FastStream(
+    broker,
+    lifespan=stream_lifespan,
+)
+
+
+# Handles up to `stream_max_workers` messages at the same time, `decompress`
+# decodes the messages the buffered publisher compressed.
+@broker.subscriber(
+    "test",
+    max_workers=settings.stream_max_workers,
+    decoder=decompress,
+)
+async def handle() -> str:
+    return "Hi!"
+
+
+# Pops up to `stream_batch_max_records` messages of the list in one call,
+# polling it every `stream_batch_max_wait_ms` while it is empty.
+@broker.subscriber(
+    list=ListSub(
+        "test-batch",
+        batch=True,
+        max_records=settings.stream_batch_max_records,
+        polling_interval=settings.stream_batch_max_wait_ms / 1000,
+    ),
+)
+async def handle_batch(messages: list[str], logger: Logger) -> None:
+    logger.info(f"Received {len(messages)} messages")
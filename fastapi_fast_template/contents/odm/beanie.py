@@ -1,14 +1,59 @@
-import motor.motor_asyncio
 from beanie import init_beanie
-from pydantic import MongoDsn
-
-
-async def init_database(
-    mongo_connection: MongoDsn,
-    mongo_db: str,
-):
-    client = motor.motor_asyncio.AsyncIOMotorClient(str(mongo_connection))
-    await init_beanie(
-        database=client[mongo_db],
-        document_models=[],  # models.Model
-    )
+from config import settings
+from pymongo import AsyncMongoClient
+
+
+class MongoClient:
+    """
+    Holds one PyMongo async client for the whole application, so every request reuses
+    the same connection pool instead of opening new connections.
+    """
+
+    def __init__(self) -> None:
+        self._client: AsyncMongoClient | None = None
+
+    async def start(self) -> None:
+        if self._client is not None:
+            return
+
+        self._client = AsyncMongoClient(
+            settings.mongo_connection,
+            appname=settings.app_name,
+            maxPoolSize=settings.mongo_max_pool_size,
+            minPoolSize=settings.mongo_min_pool_size,
+            maxIdleTimeMS=settings.mongo_max_idle_time_ms,
+            compressors=settings.mongo_compressors,
+            readPreference=settings.mongo_read_preference,
+            connectTimeoutMS=settings.mongo_connect_timeout_ms,
+            socketTimeoutMS=settings.mongo_socket_timeout_ms,
+            serverSelectionTimeoutMS=settings.mongo_server_selection_timeout_ms,
+        )
+        # Fails fast on a wrong URL and warms the pool up before the first
+        # request instead of during it.
+        await self._client.admin.command("ping")
+        await init_beanie(
+            database=self._client.get_default_database(),
+            document_models=[],  # models.Model
+        )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    @property
+    def client(self) -> AsyncMongoClient:
+        if self._client is None:
+            raise RuntimeError("The MongoDB client has not been started")
+        return self._client
+
+
+mongo_client = MongoClient()
+
+
+async def init_db() -> None:
+    await mongo_client.start()
+
+
+async def close_db() -> None:
+    await mongo_client.close()
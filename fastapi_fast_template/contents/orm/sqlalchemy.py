@@ -34,3 +34,52 @@ async def drop_and_create_all_tables():
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
+
+
+class UnitOfWork:
+    """
+    Wraps a whole request in one transaction. The session is created on first
+    use, so requests that never touch the database never check out a
+    connection. Repositories using `session` flush instead of committing.
+    """
+
+    def __init__(self) -> None:
+        self._session: AsyncSession | None = None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = async_session(info={"unit_of_work": True})
+        return self._session
+
+    async def commit(self) -> None:
+        if self._session is not None:
+            await self._session.commit()
+            for after_commit in self._session.info.pop("after_commit", []):
+                await after_commit()
+
+    async def rollback(self) -> None:
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+async def get_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    """
+    Declare it with `Depends(get_unit_of_work, scope="function")`, so the
+    transaction is committed before the response is sent and a failed commit
+    is returned to the client as an error.
+    """
+    uow = UnitOfWork()
+    try:
+        yield uow
+        await uow.commit()
+    except BaseException:
+        await uow.rollback()
+        raise
+    finally:
+        await uow.close()
@@ -1,4 +1,5 @@
 from config import settings
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session, SQLModel, create_engine
 
 connect_args = {"check_same_thread": False}
@@ -7,6 +8,7 @@ engine = create_engine(
     echo=True,
     connect_args=connect_args,
 )
+sync_session = sessionmaker(bind=engine, class_=Session)
 
 
 def create_db_and_tables():
@@ -14,5 +16,54 @@ def create_db_and_tables():
 
 
 def get_session():
-    with Session(engine) as session:
+    with sync_session() as session:
         yield session
+
+
+class UnitOfWork:
+    """
+    Wraps a whole request in one transaction. The session is created on first
+    use, so requests that never touch the database never check out a
+    connection. Repositories using `session` flush instead of committing.
+    """
+
+    def __init__(self) -> None:
+        self._session: Session | None = None
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = sync_session(info={"unit_of_work": True})
+        return self._session
+
+    def commit(self) -> None:
+        if self._session is not None:
+            self._session.commit()
+            for after_commit in self._session.info.pop("after_commit", []):
+                after_commit()
+
+    def rollback(self) -> None:
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+def get_unit_of_work():
+    """
+    Declare it with `Depends(get_unit_of_work, scope="function")`, so the
+    transaction is committed before the response is sent and a failed commit
+    is returned to the client as an error.
+    """
+    uow = UnitOfWork()
+    try:
+        yield uow
+        uow.commit()
+    except BaseException:
+        uow.rollback()
+        raise
+    finally:
+        uow.close()
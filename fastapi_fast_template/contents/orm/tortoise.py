@@ -1,17 +1,65 @@
 from config import settings
 from tortoise import Tortoise
+from tortoise.backends.base.config_generator import expand_db_url
 
+MODELS = [
+    # models.module
+]
 
-async def init_db(generate_schemas: bool = False):
-    await Tortoise.init(
-        db_url=settings.tortoise_db_url,
-        modules={
-            "models": [
-                # models.module
-            ]
+
+class ReadReplicaRouter:
+    """
+    Sends reads to the "replica" connection and writes to "default". Reads
+    that must see a write of the same request should use
+    `.using_db(connections.get("default"))`, as the replica may lag behind.
+    """
+
+    def db_for_read(self, model) -> str:
+        return "replica"
+
+    def db_for_write(self, model) -> str:
+        return "default"
+
+
+def get_connection_config(db_url: str) -> dict:
+    config = expand_db_url(db_url)
+    if config["engine"] == "tortoise.backends.asyncpg":
+        config["credentials"].update(
+            minsize=settings.tortoise_pool_min_size,
+            maxsize=settings.tortoise_pool_max_size,
+            max_inactive_connection_lifetime=(
+                settings.tortoise_max_inactive_connection_lifetime
+            ),
+            statement_cache_size=settings.tortoise_statement_cache_size,
+        )
+    return config
+
+
+def get_tortoise_config() -> dict:
+    connections = {"default": get_connection_config(settings.tortoise_db_url)}
+    routers = []
+    if settings.tortoise_read_db_url:
+        connections["replica"] = get_connection_config(
+            settings.tortoise_read_db_url
+        )
+        routers.append(ReadReplicaRouter)
+
+    return {
+        "connections": connections,
+        "apps": {
+            "models": {
+                "models": MODELS,
+                "default_connection": "default",
+            }
         },
-        timezone="Asia/Tehran",
-    )
+        "routers": routers,
+        "use_tz": True,
+        "timezone": settings.tortoise_timezone,
+    }
+
+
+async def init_db(generate_schemas: bool = False):
+    await Tortoise.init(config=get_tortoise_config())
     if generate_schemas:
         await Tortoise.generate_schemas()
 
@@ -1,30 +1,70 @@
-from typing import Generic, Optional, TypeVar
+from collections.abc import AsyncIterator
+from typing import Any, Generic, Optional, TypeVar
 
+from beanie import PydanticObjectId, SortDirection
+from beanie.exceptions import DocumentNotFound
+from beanie.odm.utils.encoder import Encoder
 from pydantic.types import PositiveInt
+from pymongo import ReplaceOne
+from pymongo.errors import DuplicateKeyError
 
 ModelType = TypeVar("ModelType")
 
 
+class ConcurrencyConflictError(Exception):
+    """
+    Raised by optimistic updates when records were changed or deleted
+    since they were read.
+    """
+
+    def __init__(self, model_name: str, ids: list) -> None:
+        super().__init__(
+            f"{model_name} records {ids} were modified concurrently"
+        )
+        self.ids = ids
+
+
+# Errors caused by the request rather than by the database, which the
+# circuit breaker does not count as failures.
+REQUEST_ERRORS = (
+    DuplicateKeyError,
+    DocumentNotFound,
+    ConcurrencyConflictError,
+)
+
+
 class BaseRepository(Generic[ModelType]):
     """
     Generic base repository class for working with Beanie models.
 
     This class provides a set of methods for creating, reading, updating, and deleting models.
     It is designed to be subclassed by specific repository implementations.
+
+    Set `optimistic_lock = True` together with an integer `version_field` to make
+    `update` and `bulk_update` raise `ConcurrencyConflictError` instead of
+    overwriting documents that were changed since they were read. MongoDB has no
+    row locks, so there is no pessimistic `get_for_update` counterpart.
     """
 
     model_class: ModelType
+    version_field: Optional[str] = None
+    optimistic_lock: bool = False
 
     def __str__(self):
         return f"{self.__class__.__name__}(model_class={self.model_class.__name__})"
 
-    async def get_by_id(self, id: str) -> Optional[ModelType]:
+    async def get_by_id(
+        self, id: str, fetch_links: bool = False
+    ) -> Optional[ModelType]:
         """
         Retrieves a single record of the associated model by its unique identifier.
 
         :param id: The unique identifier of the record to retrieve.
         :type id: str
 
+        :param fetch_links: Resolve `Link` fields in the same query with `$lookup`.
+        :type fetch_links: bool
+
         :return: An instance of the model if found, or None if no record with the specified ID exists.
         :rtype: ModelType
 
@@ -39,11 +79,39 @@ class BaseRepository(Generic[ModelType]):
             print("Record not found.")
         ```
         """
-        return await self.model_class.get(id)
+        return await self.model_class.get(id, fetch_links=fetch_links)
+
+    async def get_version(self, id: str):
+        """
+        Retrieves only the version field (see `version_field`) of a record, which is
+        much cheaper than loading the whole record when building ETags.
+
+        :param id: The unique identifier of the record.
+        :type id: str
+
+        :return: The value of the version field, or None if no record with the specified ID exists.
+        :rtype: Any
+
+        Example usage:
+        ```
+        # Answer a conditional GET before loading the record
+        version = await base_repo.get_version(record_id)
+        etag = make_etag(record_id, version)
+        ```
+        """
+        document = await self.model_class.get_pymongo_collection().find_one(
+            {"_id": PydanticObjectId(id)}, {self.version_field: True}
+        )
+        return document.get(self.version_field) if document else None
 
     async def get_all(
-        self, skip: PositiveInt = 0, limit: PositiveInt = 100
-    ) -> list[ModelType]:
+        self,
+        skip: PositiveInt = 0,
+        limit: PositiveInt = 100,
+        only: Optional[list[str]] = None,
+        row_type: Optional[type] = None,
+        fetch_links: bool = False,
+    ) -> list:
         """
         Retrieves a specified range of records of the associated model.
 
@@ -55,6 +123,19 @@ class BaseRepository(Generic[ModelType]):
                     Defaults to 100, limiting the number of records returned.
         :type limit: PositiveInt
 
+        :param only: The fields to load. When set, rows are returned instead of documents,
+                    skipping Document validation.
+        :type only: list[str] | None
+
+        :param row_type: The type of the returned rows: tuple (default), dict or a
+                    Pydantic model. A Pydantic model defaults `only` to its own fields
+                    and is loaded with `project()`.
+        :type row_type: type | None
+
+        :param fetch_links: Resolve `Link` fields in the same aggregation with `$lookup`
+                    instead of fetching them one document at a time.
+        :type fetch_links: bool
+
         :return: A list of instances of the model within the specified range.
         :rtype: list[ModelType]
 
@@ -64,14 +145,112 @@ class BaseRepository(Generic[ModelType]):
         records_range = await base_repo.get_all(skip=10, limit=20)
         for record in records_range:
             print(record)
+
+        # Retrieve only the fields a list endpoint needs
+        names = await base_repo.get_all(only=['id', 'name'], row_type=dict)
+
+        # Resolve the linked documents of every record in the same query
+        records = await base_repo.get_all(fetch_links=True)
         ```
         """
-        return (
-            await self.model_class.find_all().skip(skip).limit(limit).to_list()
-        )
+        if only is not None or row_type is not None:
+            return await self._find_rows({}, only, row_type, skip, limit)
+        query = self.model_class.find_all(fetch_links=fetch_links)
+        return await query.skip(skip).limit(limit).to_list()
+
+    async def filter_by(
+        self,
+        only: Optional[list[str]] = None,
+        row_type: Optional[type] = None,
+        fetch_links: bool = False,
+        **kwargs,
+    ) -> list:
+        if only is not None or row_type is not None:
+            return await self._find_rows(kwargs, only, row_type)
+        query = self.model_class.find(kwargs, fetch_links=fetch_links)
+        return await query.to_list()
+
+    async def get_page(
+        self,
+        after: Any = None,
+        after_id: Optional[str] = None,
+        limit: PositiveInt = 100,
+        sort_field: str = "_id",
+        descending: bool = False,
+        fetch_links: bool = False,
+        **kwargs,
+    ) -> list[ModelType]:
+        """
+        Retrieves the page of records that follows a cursor (keyset pagination). Unlike
+        `get_all`, MongoDB seeks straight to the cursor through the index instead of
+        walking over every skipped document, so deep pages stay as fast as the first one.
+
+        :param after: The `sort_field` value of the last record of the previous page, or
+                    None for the first page.
+        :type after: Any
+
+        :param after_id: The id of the last record of the previous page. Required when
+                    `sort_field` is not unique, to break ties between equal values.
+        :type after_id: str | None
+
+        :param limit: The maximum number of records to retrieve.
+        :type limit: PositiveInt
+
+        :param sort_field: The indexed field the pages are ordered by.
+        :type sort_field: str
+
+        :param descending: Order the pages from the highest to the lowest value.
+        :type descending: bool
+
+        :param fetch_links: Resolve `Link` fields in the same query.
+        :type fetch_links: bool
+
+        :param kwargs: Additional filters provided as keyword arguments.
+        :type kwargs: Any
+
+        :return: A list of instances of the model that follow the cursor.
+        :rtype: list[ModelType]
 
-    async def filter_by(self, **kwargs) -> list[ModelType]:
-        return await self.model_class.find(kwargs).to_list()
+        Example usage:
+        ```
+        # Walk a collection page by page, newest first
+        page = await base_repo.get_page(sort_field='created_at', descending=True)
+        while page:
+            last = page[-1]
+            page = await base_repo.get_page(
+                after=last.created_at,
+                after_id=last.id,
+                sort_field='created_at',
+                descending=True,
+            )
+        ```
+        """
+        if sort_field == "id":
+            sort_field = "_id"
+        operator = "$lt" if descending else "$gt"
+        direction = (
+            SortDirection.DESCENDING if descending else SortDirection.ASCENDING
+        )
+        filters = dict(kwargs)
+        sort = [(sort_field, direction)]
+        if sort_field == "_id":
+            if after is not None:
+                filters["_id"] = {operator: PydanticObjectId(after)}
+        else:
+            sort.append(("_id", direction))
+            if after is not None and after_id is None:
+                filters[sort_field] = {operator: after}
+            elif after is not None:
+                filters["$or"] = [
+                    {sort_field: {operator: after}},
+                    {
+                        sort_field: after,
+                        "_id": {operator: PydanticObjectId(after_id)},
+                    },
+                ]
+
+        query = self.model_class.find(filters, fetch_links=fetch_links)
+        return await query.sort(sort).limit(limit).to_list()
 
     async def save(self, entity: ModelType) -> ModelType:
         """
@@ -116,7 +295,9 @@ class BaseRepository(Generic[ModelType]):
         await entity.insert()
         return entity
 
-    async def update(self, id: str, update_data: dict) -> Optional[ModelType]:
+    async def update(
+        self, id: str, update_data: dict, version: Optional[int] = None
+    ) -> Optional[ModelType]:
         """
         Updates the specified model instance with the provided data and persists the changes.
 
@@ -137,9 +318,24 @@ class BaseRepository(Generic[ModelType]):
         updated_record = await base_repo.update(existing_record, age=31, city='San Francisco')
         print(f"Record updated: {updated_record}")
         ```
+
+        With `optimistic_lock` enabled, the document is only updated if its version still
+        matches `version` (the one the client read, defaulting to the stored one),
+        otherwise `ConcurrencyConflictError` is raised.
         """
         obj = await self.get_by_id(id)
         if obj:
+            if self.optimistic_lock:
+                if version is not None:
+                    setattr(obj, self.version_field, version)
+                if not await self._versioned_update(obj, update_data):
+                    raise ConcurrencyConflictError(
+                        self.model_class.__name__, [id]
+                    )
+                for key, value in update_data.items():
+                    setattr(obj, key, value)
+                return obj
+
             await obj.update({"$set": update_data})
             return obj
         return None
@@ -219,6 +415,70 @@ class BaseRepository(Generic[ModelType]):
         """
         return await self.model_class.find_all().count()
 
+    async def estimated_count(self) -> int:
+        """
+        Retrieves the number of records from the collection metadata, without scanning
+        the collection. The value can be slightly off after unclean shutdowns or on
+        sharded clusters with orphaned documents, which is fine for pagination totals.
+
+        :return: The estimated count of records in the associated data storage.
+        :rtype: int
+
+        Example usage:
+        ```
+        # Get a cheap total for the pagination of a very large collection
+        total_records = await base_repo.estimated_count()
+        ```
+        """
+        collection = self.model_class.get_pymongo_collection()
+        return await collection.estimated_document_count()
+
+    async def aggregate(
+        self,
+        pipeline: list[dict],
+        projection_model: Optional[type] = None,
+        allow_disk_use: bool = False,
+        batch_size: Optional[PositiveInt] = None,
+    ) -> AsyncIterator:
+        """
+        Runs an aggregation pipeline and streams its results one by one, fetching them from
+        the server in batches instead of loading them all into memory.
+
+        :param pipeline: The aggregation pipeline stages.
+        :type pipeline: list[dict]
+
+        :param projection_model: An optional Pydantic model each result is parsed into.
+                    Results are returned as dicts when not provided.
+        :type projection_model: type | None
+
+        :param allow_disk_use: Let stages such as `$group` and `$sort` spill to disk instead
+                    of failing when they exceed the 100MB memory limit.
+        :type allow_disk_use: bool
+
+        :param batch_size: The number of results fetched per round trip.
+        :type batch_size: PositiveInt | None
+
+        :return: An async iterator over the results.
+        :rtype: AsyncIterator
+
+        Example usage:
+        ```
+        # Stream the revenue of every customer
+        pipeline = [{'$group': {'_id': '$customer_id', 'total': {'$sum': '$amount'}}}]
+        async for row in base_repo.aggregate(pipeline, CustomerRevenue, batch_size=500):
+            print(row.total)
+        ```
+        """
+        options = {"allowDiskUse": allow_disk_use}
+        if batch_size is not None:
+            options["batchSize"] = batch_size
+
+        query = self.model_class.aggregate(
+            pipeline, projection_model=projection_model, **options
+        )
+        async for item in query:
+            yield item
+
     async def bulk_create(self, entities: list[ModelType]) -> list[ModelType]:
         """
         Creates multiple records of the associated model in bulk.
@@ -243,15 +503,29 @@ class BaseRepository(Generic[ModelType]):
         await self.model_class.insert_many(entities)
         return entities
 
-    async def bulk_update(self, entities: list[ModelType]) -> list[ModelType]:
+    async def bulk_update(
+        self,
+        entities: list[ModelType],
+        ordered: bool = True,
+        batch_size: PositiveInt = 1000,
+    ) -> dict[str, int]:
         """
-        Updates multiple records of the associated model in bulk.
+        Updates multiple records of the associated model in bulk, replacing every document
+        with one `bulk_write` round trip per batch instead of one `save()` per entity.
+        Beanie event actions are not run.
 
         :param entities: A list of model instances with updated data to be applied in bulk.
         :type entities: list[ModelType]
 
-        :return: The list of updated model instances.
-        :rtype: list[ModelType]
+        :param ordered: Stop at the first failing write (True) or let MongoDB apply the
+                    remaining writes of the batch in any order (False, faster).
+        :type ordered: bool
+
+        :param batch_size: The maximum number of writes sent in one `bulk_write` call.
+        :type batch_size: PositiveInt
+
+        :return: The number of matched and modified documents.
+        :rtype: dict[str, int]
 
         Example usage:
         ```
@@ -260,21 +534,63 @@ class BaseRepository(Generic[ModelType]):
             MyModel(id=1, name='John Doe', age=31, city='San Francisco'),
             MyModel(id=2, name='Jane Doe', age=26, city='Los Angeles'),
         ]
-        updated_records = await base_repo.bulk_update(records_to_update)
-        print(f"{len(updated_records)} records updated in bulk.")
+        result = await base_repo.bulk_update(records_to_update, ordered=False)
+        print(f"{result['modified']} records updated in bulk.")
         ```
-        """
-        for entity in entities:
-            await entity.save()
-        return entities
 
-    async def bulk_delete(self, entities: list[ModelType]) -> None:
+        With `optimistic_lock` enabled, every document is only updated if its version
+        still matches the one carried by the entity, otherwise `ConcurrencyConflictError`
+        is raised with the ids of the conflicting documents. The versioned writes are
+        sent one by one, so conflicts can be attributed to documents.
+        """
+        counts = {"matched": 0, "modified": 0}
+        if self.optimistic_lock:
+            conflicts = []
+            for entity in entities:
+                values = Encoder(
+                    exclude={"_id", "revision_id", self.version_field},
+                    to_db=True,
+                ).encode(entity)
+                if await self._versioned_update(entity, values):
+                    counts["matched"] += 1
+                    counts["modified"] += 1
+                else:
+                    conflicts.append(entity.id)
+            if conflicts:
+                raise ConcurrencyConflictError(
+                    self.model_class.__name__, conflicts
+                )
+            return counts
+
+        collection = self.model_class.get_pymongo_collection()
+        encoder = Encoder(to_db=True)
+        for start in range(0, len(entities), batch_size):
+            operations = [
+                ReplaceOne({"_id": entity.id}, encoder.encode(entity))
+                for entity in entities[start : start + batch_size]
+            ]
+            result = await collection.bulk_write(operations, ordered=ordered)
+            counts["matched"] += result.matched_count
+            counts["modified"] += result.modified_count
+        return counts
+
+    async def bulk_delete(
+        self, entities: list[ModelType], batch_size: PositiveInt = 1000
+    ) -> int:
         """
-        Deletes multiple records of the associated model in bulk.
+        Deletes multiple records of the associated model in bulk, with one `delete_many`
+        round trip per batch instead of one `delete()` per entity. Beanie event actions
+        are not run.
 
         :param entities: A list of model instances to be deleted in bulk.
         :type entities: List[ModelType]
 
+        :param batch_size: The maximum number of ids sent in one `delete_many` call.
+        :type batch_size: PositiveInt
+
+        :return: The number of deleted documents.
+        :rtype: int
+
         Example usage:
         ```
         # Delete multiple records in bulk
@@ -282,9 +598,62 @@ class BaseRepository(Generic[ModelType]):
             MyModel(id=1),
             MyModel(id=2),
         ]
-        await base_repo.bulk_delete(records_to_delete)
-        print(f"{len(records_to_delete)} records deleted in bulk.")
+        deleted = await base_repo.bulk_delete(records_to_delete)
+        print(f"{deleted} records deleted in bulk.")
         ```
         """
-        for entity in entities:
-            await entity.delete()
+        collection = self.model_class.get_pymongo_collection()
+        deleted = 0
+        for start in range(0, len(entities), batch_size):
+            ids = [
+                entity.id for entity in entities[start : start + batch_size]
+            ]
+            result = await collection.delete_many({"_id": {"$in": ids}})
+            deleted += result.deleted_count
+        return deleted
+
+    async def _find_rows(
+        self,
+        filters: dict,
+        only: Optional[list[str]],
+        row_type: Optional[type],
+        skip: int = 0,
+        limit: int = 0,
+    ) -> list:
+        is_model = row_type not in (None, tuple, dict)
+        if only is None and is_model:
+            query = self.model_class.find(filters).skip(skip).limit(limit)
+            return await query.project(row_type).to_list()
+
+        fields = only or list(self.model_class.model_fields)
+        keys = ["_id" if field == "id" else field for field in fields]
+        cursor = self.model_class.get_pymongo_collection().find(
+            filters,
+            {"_id": False, **dict.fromkeys(keys, True)},
+            skip=skip,
+            limit=limit,
+        )
+        rows = [
+            {
+                field: document.get(key)
+                for field, key in zip(fields, keys, strict=True)
+            }
+            async for document in cursor
+        ]
+        if is_model:
+            return [row_type.model_validate(row) for row in rows]
+        if row_type is dict:
+            return rows
+        return [tuple(row.values()) for row in rows]
+
+    async def _versioned_update(self, entity: ModelType, values: dict) -> bool:
+        version = getattr(entity, self.version_field)
+        values = {**values, self.version_field: version + 1}
+        result = await self.model_class.get_pymongo_collection().update_one(
+            {"_id": entity.id, self.version_field: version}, {"$set": values}
+        )
+        if result.matched_count == 0:
+            return False
+
+        setattr(entity, self.version_field, version + 1)
+        return True
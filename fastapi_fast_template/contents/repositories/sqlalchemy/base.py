@@ -1,12 +1,43 @@
+import json
 from typing import Generic, TypeVar
 
 from pydantic.types import PositiveInt
-from sqlalchemy import Select, select
+from sqlalchemy import (
+    Select,
+    Update,
+    func,
+    inspect,
+    literal_column,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 ModelType = TypeVar("ModelType")
 
 
+class ConcurrencyConflictError(Exception):
+    """
+    Raised by optimistic updates when records were changed or deleted
+    since they were read.
+    """
+
+    def __init__(self, model_name: str, ids: list) -> None:
+        super().__init__(
+            f"{model_name} records {ids} were modified concurrently"
+        )
+        self.ids = ids
+
+
+# Errors caused by the request rather than by the database, which the
+# circuit breaker does not count as failures.
+REQUEST_ERRORS = (IntegrityError, NoResultFound, ConcurrencyConflictError)
+
+
 class BaseRepository(Generic[ModelType]):
     """
     Generic base repository class for working with SQLAlchemy models.
@@ -16,20 +47,36 @@ class BaseRepository(Generic[ModelType]):
 
     Parameters:
     - db_session (AsyncSession): The asynchronous database session to use for database operations.
+
+    Set `optimistic_lock = True` together with an integer `version_field` to make
+    `update` and `bulk_update` raise `ConcurrencyConflictError` instead of
+    overwriting records that were changed since they were read.
+
+    `count(estimated=True)` only trusts planner estimates of at least
+    `exact_count_threshold` rows and counts exactly below it.
     """
 
     model_class: ModelType
+    version_field: str | None = None
+    optimistic_lock: bool = False
+    exact_count_threshold: int = 1000
 
     def __init__(self, db_session: AsyncSession) -> None:
         self.session = db_session
 
-    async def get_by_id(self, id: PositiveInt) -> ModelType | None:
+    async def get_by_id(
+        self, id: PositiveInt, options: list | None = None
+    ) -> ModelType | None:
         """
         Retrieves a single record of the associated model by its unique identifier.
 
         :param id: The unique identifier of the record to retrieve.
         :type id: PositiveInt
 
+        :param options: Relationships to eager load, as loader options such as
+                    `joinedload(Model.owner)` or relationship names loaded with `selectinload`.
+        :type options: list | None
+
         :return: An instance of the model if found, or None if no record with the specified ID exists.
         :rtype: ModelType | None
 
@@ -44,16 +91,119 @@ class BaseRepository(Generic[ModelType]):
             print("Record not found.")
         ```
         """
-        query = self._select()
+        query = self._select().options(*self._get_options(options))
+        query = query.filter(self.model_class.id == id)
+        query = await self.session.scalars(query)
+        return query.unique().one_or_none()
+
+    async def get_version(self, id: PositiveInt):
+        """
+        Retrieves only the version column (see `version_field`) of a record, which is
+        much cheaper than loading the whole record when building ETags.
+
+        :param id: The unique identifier of the record.
+        :type id: PositiveInt
+
+        :return: The value of the version column, or None if no record with the specified ID exists.
+        :rtype: Any
+
+        Example usage:
+        ```
+        # Answer a conditional GET before loading the record
+        version = await base_repo.get_version(record_id)
+        etag = make_etag(record_id, version)
+        ```
+        """
+        query = select(getattr(self.model_class, self.version_field))
+        query = query.filter(self.model_class.id == id)
+        return await self.session.scalar(query)
+
+    async def get_for_update(
+        self,
+        id: PositiveInt,
+        skip_locked: bool = False,
+        nowait: bool = False,
+    ) -> ModelType | None:
+        """
+        Retrieves a record and locks its row with `SELECT ... FOR UPDATE` until the
+        current transaction ends.
+
+        :param id: The unique identifier of the record to lock.
+        :type id: PositiveInt
+
+        :param skip_locked: Return None instead of waiting when the row is already locked.
+        :type skip_locked: bool
+
+        :param nowait: Raise an error instead of waiting when the row is already locked.
+        :type nowait: bool
+
+        :return: The locked instance of the model, or None if it does not exist or is locked
+                    by another transaction and `skip_locked` is set.
+        :rtype: ModelType | None
+
+        Example usage:
+        ```
+        # Increment a balance without losing concurrent writes
+        account = await base_repo.get_for_update(account_id)
+        await base_repo.update(account, balance=account.balance + amount)
+        ```
+        """
+        query = self._select().with_for_update(
+            skip_locked=skip_locked, nowait=nowait
+        )
         query = query.filter(self.model_class.id == id)
         query = await self.session.scalars(query)
         return query.one_or_none()
 
+    async def filter_for_update(
+        self,
+        limit: PositiveInt = 100,
+        skip_locked: bool = True,
+        nowait: bool = False,
+        **kwargs,
+    ) -> list[ModelType]:
+        """
+        Retrieves and locks up to `limit` records matching the filters. With the default
+        `skip_locked=True`, rows locked by other transactions are skipped, so many workers
+        can consume a queue-like table concurrently without waiting on each other.
+
+        :param limit: The maximum number of records to lock.
+        :type limit: PositiveInt
+
+        :param skip_locked: Skip rows that are already locked instead of waiting for them.
+        :type skip_locked: bool
+
+        :param nowait: Raise an error instead of waiting when a row is already locked.
+        :type nowait: bool
+
+        :param kwargs: Filters applied with the standard filter syntax of SQLAlchemy.
+        :type kwargs: Any
+
+        :return: The locked model instances.
+        :rtype: list[ModelType]
+
+        Example usage:
+        ```
+        # Claim a batch of pending jobs
+        jobs = await base_repo.filter_for_update(limit=10, status='pending')
+        for job in jobs:
+            await base_repo.update(job, status='running', commit=False)
+        await base_repo.commit()
+        ```
+        """
+        query = self._select().filter_by(**kwargs).limit(limit)
+        query = query.with_for_update(skip_locked=skip_locked, nowait=nowait)
+        query = await self.session.scalars(query)
+        return query.all()
+
     async def get_all(
         self,
         skip: PositiveInt = 0,
         limit: PositiveInt = 100,
-    ) -> list[ModelType]:
+        only: list[str] | None = None,
+        row_type: type | None = None,
+        options: list | None = None,
+    ) -> list:
         """
         Retrieves a specified range of records of the associated model.
 
@@ -65,6 +215,18 @@ class BaseRepository(Generic[ModelType]):
                     Defaults to 100, limiting the number of records returned.
         :type limit: PositiveInt
 
+        :param only: The columns to load. When set, rows are returned instead of model
+                    instances, skipping the ORM identity map and object hydration.
+        :type only: list[str] | None
+
+        :param row_type: The type of the returned rows: tuple (default), dict or a
+                    Pydantic model. A Pydantic model defaults `only` to its own fields.
+        :type row_type: type | None
+
+        :param options: Relationships to eager load (see `get_by_id`), so accessing them on
+                    the returned records does not trigger one lazy load per record.
+        :type options: list | None
+
         :return: A list of instances of the model within the specified range.
         :rtype: list[ModelType]
 
@@ -74,16 +236,30 @@ class BaseRepository(Generic[ModelType]):
         records_range = await base_repo.get_all(skip=10, limit=20)
         for record in records_range:
             print(record)
+
+        # Retrieve only the columns a list endpoint needs
+        names = await base_repo.get_all(only=['id', 'name'], row_type=dict)
+
+        # Load the tags of every record in one extra query
+        records = await base_repo.get_all(options=['tags'])
         ```
         """
         query = self._select()
         query = query.offset(skip).limit(limit)
+        if only is not None or row_type is not None:
+            return await self._fetch_rows(query, only, row_type)
+        query = query.options(*self._get_options(options))
         query = await self.session.scalars(query)
-        return query.all()
+        return query.unique().all()
 
     async def filter_by(
-        self, query: Select = None, **kwargs
-    ) -> list[ModelType]:
+        self,
+        query: Select = None,
+        only: list[str] | None = None,
+        row_type: type | None = None,
+        options: list | None = None,
+        **kwargs,
+    ) -> list:
         """
         Filters records of the associated model based on provided filters and keyword arguments.
 
@@ -91,6 +267,15 @@ class BaseRepository(Generic[ModelType]):
                     a default query is created using the `_select` method.
         :type query: Select | None
 
+        :param only: The columns to load instead of whole model instances (see `get_all`).
+        :type only: list[str] | None
+
+        :param row_type: The type of the returned rows: tuple (default), dict or a Pydantic model.
+        :type row_type: type | None
+
+        :param options: Relationships to eager load (see `get_by_id`).
+        :type options: list | None
+
         :param kwargs: Additional filters provided as keyword arguments.
                     These are applied using the standard filter syntax of SQLAlchemy.
         :type kwargs: Any
@@ -106,12 +291,18 @@ class BaseRepository(Generic[ModelType]):
 
         # Filter records using the default query and additional keyword filters
         results = await base_repo.filter_by(name='John', city='New York')
+
+        # Build response models straight from the selected columns
+        results = await base_repo.filter_by(row_type=ProductSummary, is_active=True)
         ```
         """
         query = self._select() if query is None else query
         query = query.filter_by(**kwargs)
+        if only is not None or row_type is not None:
+            return await self._fetch_rows(query, only, row_type)
+        query = query.options(*self._get_options(options))
         query = await self.session.scalars(query)
-        return query.all()
+        return query.unique().all()
 
     async def commit(self, commit: bool = True, rollback: bool = True) -> None:
         """
@@ -121,7 +312,19 @@ class BaseRepository(Generic[ModelType]):
         - commit (bool): Flag indicating whether to commit changes (default: True).
         - rollback (bool): Flag indicating whether to rollback changes on exception (default: True).
 
+        When the session belongs to a `UnitOfWork`, changes are only flushed and
+        the unit of work commits or rolls back the whole request. `before_commit`
+        then runs before the flush and `after_commit` once the unit of work has
+        committed.
+
         """
+        if self.session.info.get("unit_of_work"):
+            await self.before_commit()
+            await self.session.flush()
+            hooks = self.session.info.setdefault("after_commit", [])
+            if self.after_commit not in hooks:
+                hooks.append(self.after_commit)
+            return
 
         try:
             if commit:
@@ -216,9 +419,16 @@ class BaseRepository(Generic[ModelType]):
         updated_record = await base_repo.update(existing_record, age=31, city='San Francisco')
         print(f"Record updated: {updated_record}")
         ```
+
+        With `optimistic_lock` enabled, the record is only updated if its version still
+        matches the one that was read, otherwise `ConcurrencyConflictError` is raised.
         """
-        for key, value in kwargs.items():
-            setattr(entity, key, value)
+        if self.optimistic_lock:
+            if not await self._versioned_update(entity, kwargs):
+                await self._raise_conflict([entity.id])
+        else:
+            for key, value in kwargs.items():
+                setattr(entity, key, value)
 
         await self.commit(commit)
         return entity
@@ -240,7 +450,10 @@ class BaseRepository(Generic[ModelType]):
         ```
         """
         await self.session.delete(entity)
-        await self.session.commit()
+        if self.session.info.get("unit_of_work"):
+            await self.commit()
+        else:
+            await self.session.commit()
 
     async def delete_by_id(self, id: PositiveInt) -> None:
         """
@@ -260,14 +473,19 @@ class BaseRepository(Generic[ModelType]):
         entity = await self.get_by_id(id)
         await self.delete(entity)
 
-    async def exists(self, id: PositiveInt) -> bool:
+    async def exists(self, id: PositiveInt | None = None, **kwargs) -> bool:
         """
-        Checks if a record with the specified unique identifier exists in the associated data storage.
+        Checks if a record with the specified unique identifier, or any record matching the
+        provided filters, exists in the associated data storage. The check compiles to
+        `SELECT EXISTS(SELECT 1 ... LIMIT 1)`, so no row is loaded.
 
         :param id: The unique identifier of the record to check for existence.
-        :type id: PositiveInt
+        :type id: PositiveInt | None
+
+        :param kwargs: Filters applied with the standard filter syntax of SQLAlchemy.
+        :type kwargs: Any
 
-        :return: True if a record with the specified ID exists, False otherwise.
+        :return: True if a matching record exists, False otherwise.
         :rtype: bool
 
         Example usage:
@@ -278,11 +496,74 @@ class BaseRepository(Generic[ModelType]):
             print("Record exists.")
         else:
             print("Record does not exist.")
+
+        # Check if the email is already taken
+        if await base_repo.exists(email='john@example.com'):
+            print("Email is taken.")
         ```
         """
-        query = self._select()
-        query = query.filter(self.model_class.id == id).exists()
-        return await self.session.scalars(query)
+        if id is not None:
+            kwargs["id"] = id
+        query = select(literal_column("1")).select_from(self.model_class)
+        query = query.filter_by(**kwargs).limit(1)
+        return await self.session.scalar(select(query.exists()))
+
+    async def exists_many(self, ids: list[PositiveInt]) -> set[PositiveInt]:
+        """
+        Checks which of the specified unique identifiers exist, in a single query.
+
+        :param ids: The unique identifiers to check for existence.
+        :type ids: list[PositiveInt]
+
+        :return: The subset of `ids` that exist in the associated data storage.
+        :rtype: set[PositiveInt]
+
+        Example usage:
+        ```
+        # Find the ids of a payload that do not exist
+        missing_ids = set(product_ids) - await base_repo.exists_many(product_ids)
+        ```
+        """
+        if not ids:
+            return set()
+        query = select(self.model_class.id).where(self.model_class.id.in_(ids))
+        return set(await self.session.scalars(query))
+
+    async def count(self, estimated: bool = False, **kwargs) -> int:
+        """
+        Counts the records matching the provided filters with `SELECT count(*)`, without
+        loading any rows.
+
+        :param estimated: On PostgreSQL, return the planner's row estimate instead of an exact
+                    count: `pg_class.reltuples` without filters, or the `EXPLAIN` row
+                    estimate with filters. Estimates below `exact_count_threshold`, or
+                    unavailable ones (e.g. on never analyzed tables), fall back to the
+                    exact count.
+        :type estimated: bool
+
+        :param kwargs: Filters applied with the standard filter syntax of SQLAlchemy.
+        :type kwargs: Any
+
+        :return: The number of matching records.
+        :rtype: int
+
+        Example usage:
+        ```
+        # Get the exact number of active records
+        total_active = await base_repo.count(is_active=True)
+
+        # Get a cheap total for the pagination of a very large table
+        total_records = await base_repo.count(estimated=True)
+        ```
+        """
+        if estimated and self.session.get_bind().dialect.name == "postgresql":
+            estimate = await self._estimate_count(kwargs)
+            if estimate is not None and estimate >= self.exact_count_threshold:
+                return estimate
+
+        query = select(func.count()).select_from(self.model_class)
+        query = query.filter_by(**kwargs)
+        return await self.session.scalar(query)
 
     async def bulk_create(
         self, entities: list[ModelType], commit: bool = True
@@ -337,9 +618,22 @@ class BaseRepository(Generic[ModelType]):
         updated_records = await base_repo.bulk_update(records_to_update)
         print(f"{len(updated_records)} records updated in bulk.")
         ```
+
+        With `optimistic_lock` enabled, every record is only updated if its version still
+        matches the one carried by the entity, otherwise `ConcurrencyConflictError` is
+        raised with the ids of the conflicting records.
         """
-        for entity in entities:
-            await self.session.merge(entity)
+        if self.optimistic_lock:
+            conflicts = []
+            for entity in entities:
+                values = self._get_changed_values(entity)
+                if not await self._versioned_update(entity, values):
+                    conflicts.append(entity.id)
+            if conflicts:
+                await self._raise_conflict(conflicts)
+        else:
+            for entity in entities:
+                await self.session.merge(entity)
         await self.commit(commit)
         return entities
 
@@ -370,3 +664,101 @@ class BaseRepository(Generic[ModelType]):
 
     def _select(self) -> Select:
         return select(self.model_class)
+
+    def _update(self) -> Update:
+        return update(self.model_class)
+
+    def _get_options(self, options: list | None) -> list:
+        return [
+            (
+                selectinload(getattr(self.model_class, option))
+                if isinstance(option, str)
+                else option
+            )
+            for option in options or ()
+        ]
+
+    async def _fetch_rows(
+        self, query: Select, only: list[str] | None, row_type: type | None
+    ) -> list:
+        is_model = row_type not in (None, tuple, dict)
+        if only is None:
+            mapper = inspect(self.model_class)
+            only = (
+                list(row_type.model_fields)
+                if is_model
+                else [column.key for column in mapper.column_attrs]
+            )
+
+        query = query.with_only_columns(
+            *(getattr(self.model_class, name).label(name) for name in only)
+        )
+        rows = (await self.session.execute(query)).all()
+        if is_model:
+            return [row_type.model_validate(row._asdict()) for row in rows]
+        if row_type is dict:
+            return [row._asdict() for row in rows]
+        return rows
+
+    async def _estimate_count(self, filters: dict) -> int | None:
+        if not filters:
+            estimate = await self.session.scalar(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = to_regclass(:table_name)"
+                ),
+                {"table_name": self.model_class.__table__.fullname},
+            )
+            return estimate if estimate is not None and estimate >= 0 else None
+
+        # EXPLAIN cannot wrap a Select, so the compiled SQL is sent with its
+        # bind parameters rather than with the values inlined in the text.
+        query = (
+            self._select()
+            .filter_by(**filters)
+            .compile(dialect=self.session.get_bind().dialect)
+        )
+        params = query.params
+        if query.positional:
+            params = tuple(params[name] for name in query.positiontup)
+        connection = await self.session.connection()
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {query}", params
+        )
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return plan[0]["Plan"]["Plan Rows"]
+
+    async def _versioned_update(self, entity: ModelType, values: dict) -> bool:
+        version = getattr(entity, self.version_field)
+        values = {**values, self.version_field: version + 1}
+        result = await self.session.execute(
+            self._update()
+            .where(
+                self.model_class.id == entity.id,
+                getattr(self.model_class, self.version_field) == version,
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return False
+
+        for key, value in values.items():
+            set_committed_value(entity, key, value)
+        return True
+
+    def _get_changed_values(self, entity: ModelType) -> dict:
+        mapper = inspect(self.model_class)
+        columns = {column.key for column in mapper.column_attrs}
+        return {
+            key: value
+            for key, value in inspect(entity).dict.items()
+            if key in columns and key not in ("id", self.version_field)
+        }
+
+    async def _raise_conflict(self, ids: list) -> None:
+        if not self.session.info.get("unit_of_work"):
+            await self.session.rollback()
+        raise ConcurrencyConflictError(self.model_class.__name__, ids)
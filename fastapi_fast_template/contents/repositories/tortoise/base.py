@@ -1,31 +1,62 @@
 from typing import Generic, TypeVar
 
 from pydantic.types import PositiveInt
-from tortoise.queryset import Q
+from tortoise.exceptions import DoesNotExist, IntegrityError
+from tortoise.queryset import Q, QuerySet
 
 ModelType = TypeVar("ModelType")
 
 
+class ConcurrencyConflictError(Exception):
+    """
+    Raised by optimistic updates when records were changed or deleted
+    since they were read.
+    """
+
+    def __init__(self, model_name: str, ids: list) -> None:
+        super().__init__(
+            f"{model_name} records {ids} were modified concurrently"
+        )
+        self.ids = ids
+
+
+# Errors caused by the request rather than by the database, which the
+# circuit breaker does not count as failures.
+REQUEST_ERRORS = (IntegrityError, DoesNotExist, ConcurrencyConflictError)
+
+
 class BaseRepository(Generic[ModelType]):
     """
     Generic base repository class for working with TORTOISE models.
 
     This class provides a set of methods for creating, reading, updating, and deleting models.
     It is designed to be subclassed by specific repository implementations.
+
+    Set `optimistic_lock = True` together with an integer `version_field` to make
+    `update` and `bulk_update` raise `ConcurrencyConflictError` instead of
+    overwriting records that were changed since they were read.
     """
 
     model_class: ModelType
+    version_field: str | None = None
+    optimistic_lock: bool = False
 
     def __str__(self):
         return f"{self.__class__.__name__}(id={self.id})"
 
-    async def get_by_id(self, id: PositiveInt) -> ModelType | None:
+    async def get_by_id(
+        self, id: PositiveInt, prefetch: list | None = None
+    ) -> ModelType | None:
         """
         Retrieves a single record of the associated model by its unique identifier.
 
         :param id: The unique identifier of the record to retrieve.
         :type id: PositiveInt
 
+        :param prefetch: Relations to load with `prefetch_related`, given as relation names
+                    (e.g. 'tags' or 'author__profile') or `Prefetch` objects.
+        :type prefetch: list | None
+
         :return: An instance of the model if found, or None if no record with the specified ID exists.
         :rtype: ModelType | None
 
@@ -41,13 +72,122 @@ class BaseRepository(Generic[ModelType]):
         ```
         """
 
-        return await self.model_class.get_or_none(pk=id)
+        return await self.model_class.get_or_none(pk=id).prefetch_related(
+            *prefetch or ()
+        )
+
+    async def get_version(self, id: PositiveInt):
+        """
+        Retrieves only the version column (see `version_field`) of a record, which is
+        much cheaper than loading the whole record when building ETags.
+
+        :param id: The unique identifier of the record.
+        :type id: PositiveInt
+
+        :return: The value of the version column, or None if no record with the specified ID exists.
+        :rtype: Any
+
+        Example usage:
+        ```
+        # Answer a conditional GET before loading the record
+        version = await base_repo.get_version(record_id)
+        etag = make_etag(record_id, version)
+        ```
+        """
+        return (
+            await self.model_class.filter(pk=id)
+            .first()
+            .values_list(self.version_field, flat=True)
+        )
+
+    async def get_for_update(
+        self,
+        id: PositiveInt,
+        skip_locked: bool = False,
+        nowait: bool = False,
+    ) -> ModelType | None:
+        """
+        Retrieves a record and locks its row with `SELECT ... FOR UPDATE` until the
+        current transaction ends, so it must be called inside `in_transaction()`.
+
+        :param id: The unique identifier of the record to lock.
+        :type id: PositiveInt
+
+        :param skip_locked: Return None instead of waiting when the row is already locked.
+        :type skip_locked: bool
+
+        :param nowait: Raise an error instead of waiting when the row is already locked.
+        :type nowait: bool
+
+        :return: The locked instance of the model, or None if it does not exist or is locked
+                    by another transaction and `skip_locked` is set.
+        :rtype: ModelType | None
+
+        Example usage:
+        ```
+        # Increment a balance without losing concurrent writes
+        async with in_transaction():
+            account = await base_repo.get_for_update(account_id)
+            await base_repo.update(account, balance=account.balance + amount)
+        ```
+        """
+        return (
+            await self.model_class.filter(pk=id)
+            .select_for_update(skip_locked=skip_locked, nowait=nowait)
+            .first()
+        )
+
+    async def filter_for_update(
+        self,
+        limit: PositiveInt = 100,
+        skip_locked: bool = True,
+        nowait: bool = False,
+        **kwargs,
+    ) -> list[ModelType]:
+        """
+        Retrieves and locks up to `limit` records matching the filters. With the default
+        `skip_locked=True`, rows locked by other transactions are skipped, so many workers
+        can consume a queue-like table concurrently without waiting on each other.
+        Must be called inside `in_transaction()`.
+
+        :param limit: The maximum number of records to lock.
+        :type limit: PositiveInt
+
+        :param skip_locked: Skip rows that are already locked instead of waiting for them.
+        :type skip_locked: bool
+
+        :param nowait: Raise an error instead of waiting when a row is already locked.
+        :type nowait: bool
+
+        :param kwargs: Filters applied with the standard filter syntax of Tortoise ORM.
+        :type kwargs: Any
+
+        :return: The locked model instances.
+        :rtype: list[ModelType]
+
+        Example usage:
+        ```
+        # Claim a batch of pending jobs
+        async with in_transaction():
+            jobs = await base_repo.filter_for_update(limit=10, status='pending')
+            for job in jobs:
+                await base_repo.update(job, status='running')
+        ```
+        """
+        return (
+            await self.model_class.filter(**kwargs)
+            .limit(limit)
+            .select_for_update(skip_locked=skip_locked, nowait=nowait)
+        )
 
     async def get_all(
         self,
         skip: PositiveInt = 0,
         limit: PositiveInt = 100,
-    ) -> list[ModelType]:
+        only: list[str] | None = None,
+        row_type: type | None = None,
+        prefetch: list | None = None,
+    ) -> list:
         """
         Retrieves a specified range of records of the associated model.
 
@@ -59,6 +199,18 @@ class BaseRepository(Generic[ModelType]):
                     Defaults to 100, limiting the number of records returned.
         :type limit: PositiveInt
 
+        :param only: The fields to load. When set, rows are returned instead of model
+                    instances, skipping model instantiation.
+        :type only: list[str] | None
+
+        :param row_type: The type of the returned rows: tuple (default), dict or a
+                    Pydantic model. A Pydantic model defaults `only` to its own fields.
+        :type row_type: type | None
+
+        :param prefetch: Relations to load (see `get_by_id`), with one query per relation
+                    instead of one per record.
+        :type prefetch: list | None
+
         :return: A list of instances of the model within the specified range.
         :rtype: list[ModelType]
 
@@ -68,11 +220,27 @@ class BaseRepository(Generic[ModelType]):
         records_range = await base_repo.get_all(skip=10, limit=20)
         for record in records_range:
             print(record)
+
+        # Retrieve only the fields a list endpoint needs
+        names = await base_repo.get_all(only=['id', 'name'], row_type=dict)
+
+        # Load the tags of every record in one extra query
+        records = await base_repo.get_all(prefetch=['tags'])
         ```
         """
-        return await self.model_class.all().offset(skip).limit(limit)
+        query = self.model_class.all().offset(skip).limit(limit)
+        if only is not None or row_type is not None:
+            return await self._fetch_rows(query, only, row_type)
+        return await query.prefetch_related(*prefetch or ())
 
-    async def filter_by(self, q_filters: Q = Q(), **kwargs) -> list[ModelType]:
+    async def filter_by(
+        self,
+        q_filters: Q = Q(),
+        only: list[str] | None = None,
+        row_type: type | None = None,
+        prefetch: list | None = None,
+        **kwargs,
+    ) -> list:
         """
         Filters records of the associated model based on provided filters and keyword arguments.
 
@@ -80,6 +248,15 @@ class BaseRepository(Generic[ModelType]):
                         Defaults to an empty Q(), meaning no additional filters.
         :type q_filters: Q
 
+        :param only: The fields to load instead of whole model instances (see `get_all`).
+        :type only: list[str] | None
+
+        :param row_type: The type of the returned rows: tuple (default), dict or a Pydantic model.
+        :type row_type: type | None
+
+        :param prefetch: Relations to load (see `get_by_id`).
+        :type prefetch: list | None
+
         :param kwargs: Additional filters provided as keyword arguments.
                     These are applied using the standard filter syntax of Tortoise ORM.
         :type kwargs: Any
@@ -95,9 +272,15 @@ class BaseRepository(Generic[ModelType]):
 
         # Filter without using Q objects
         results = await base_repo.filter_by(city='New York', is_active=True)
+
+        # Build response models straight from the selected fields
+        results = await base_repo.filter_by(row_type=ProductSummary, is_active=True)
         ```
         """
-        return await self.model_class.filter(q_filters, **kwargs)
+        query = self.model_class.filter(q_filters, **kwargs)
+        if only is not None or row_type is not None:
+            return await self._fetch_rows(query, only, row_type)
+        return await query.prefetch_related(*prefetch or ())
 
     async def save(self, entity: ModelType) -> ModelType:
         """
@@ -166,7 +349,17 @@ class BaseRepository(Generic[ModelType]):
         updated_record = await base_repo.update(existing_record, age=31, city='San Francisco')
         print(f"Record updated: {updated_record}")
         ```
+
+        With `optimistic_lock` enabled, the record is only updated if its version still
+        matches the one that was read, otherwise `ConcurrencyConflictError` is raised.
         """
+        if self.optimistic_lock:
+            if not await self._versioned_update(entity, kwargs):
+                raise ConcurrencyConflictError(
+                    self.model_class.__name__, [entity.pk]
+                )
+            return entity
+
         for key, value in kwargs.items():
             setattr(entity, key, value)
 
@@ -246,13 +439,32 @@ class BaseRepository(Generic[ModelType]):
         """
         return await self.model_class.all().count()
 
-    async def bulk_create(self, entities: list[ModelType]) -> list[ModelType]:
+    async def bulk_create(
+        self,
+        entities: list[ModelType],
+        batch_size: int | None = 1000,
+        ignore_conflicts: bool = False,
+        on_conflict: list[str] | None = None,
+        update_fields: list[str] | None = None,
+    ) -> list[ModelType]:
         """
         Creates multiple records of the associated model in bulk.
 
         :param entities: A list of model instances to be created in bulk.
         :type entities: list[ModelType]
 
+        :param batch_size: The number of records inserted per statement, None for all at once.
+        :type batch_size: int | None
+
+        :param ignore_conflicts: Skip the records that violate a unique constraint.
+        :type ignore_conflicts: bool
+
+        :param on_conflict: The fields of the unique constraint to upsert on, used with `update_fields`.
+        :type on_conflict: list[str] | None
+
+        :param update_fields: The fields overwritten when a record already exists.
+        :type update_fields: list[str] | None
+
         :return: The list of created model instances.
         :rtype: list[ModelType]
 
@@ -265,18 +477,40 @@ class BaseRepository(Generic[ModelType]):
         ]
         created_records = await base_repo.bulk_create(records_to_create)
         print(f"{len(created_records)} records created in bulk.")
+
+        # Insert or update on the "email" unique constraint
+        await base_repo.bulk_create(
+            records, on_conflict=["email"], update_fields=["name", "age"]
+        )
         ```
         """
-        await self.model_class.bulk_create(entities)
+        await self.model_class.bulk_create(
+            entities,
+            batch_size=batch_size,
+            ignore_conflicts=ignore_conflicts,
+            on_conflict=on_conflict,
+            update_fields=update_fields,
+        )
         return entities
 
-    async def bulk_update(self, entities: list[ModelType]) -> list[ModelType]:
+    async def bulk_update(
+        self,
+        entities: list[ModelType],
+        fields: list[str] | None = None,
+        batch_size: int | None = 1000,
+    ) -> list[ModelType]:
         """
         Updates multiple records of the associated model in bulk.
 
         :param entities: A list of model instances with updated data to be applied in bulk.
         :type entities: list[ModelType]
 
+        :param fields: The fields to update, all the fields except the primary key by default.
+        :type fields: list[str] | None
+
+        :param batch_size: The number of records updated per statement, None for all at once.
+        :type batch_size: int | None
+
         :return: The list of updated model instances.
         :rtype: list[ModelType]
 
@@ -287,20 +521,54 @@ class BaseRepository(Generic[ModelType]):
             MyModel(id=1, name='John Doe', age=31, city='San Francisco'),
             MyModel(id=2, name='Jane Doe', age=26, city='Los Angeles'),
         ]
-        updated_records = await base_repo.bulk_update(records_to_update)
+        updated_records = await base_repo.bulk_update(
+            records_to_update, fields=["age", "city"]
+        )
         print(f"{len(updated_records)} records updated in bulk.")
         ```
+
+        With `optimistic_lock` enabled, every record is only updated if its version still
+        matches the one carried by the entity, otherwise `ConcurrencyConflictError` is
+        raised with the ids of the conflicting records. Run it inside `in_transaction()`
+        to discard the records that were updated before the conflict.
         """
-        await self.model_class.bulk_update(entities)
+        if self.optimistic_lock:
+            conflicts = []
+            for entity in entities:
+                values = self._get_values(entity)
+                if fields is not None:
+                    values = {field: values[field] for field in fields}
+                if not await self._versioned_update(entity, values):
+                    conflicts.append(entity.pk)
+            if conflicts:
+                raise ConcurrencyConflictError(
+                    self.model_class.__name__, conflicts
+                )
+            return entities
+
+        if entities:
+            await self.model_class.bulk_update(
+                entities,
+                fields=fields or self._get_update_fields(),
+                batch_size=batch_size,
+            )
         return entities
 
-    async def bulk_delete(self, entities: list[ModelType]) -> None:
+    async def bulk_delete(
+        self, entities: list[ModelType], batch_size: int = 1000
+    ) -> int:
         """
         Deletes multiple records of the associated model in bulk.
 
         :param entities: A list of model instances to be deleted in bulk.
         :type entities: List[ModelType]
 
+        :param batch_size: The number of primary keys sent per DELETE statement.
+        :type batch_size: int
+
+        :return: The number of deleted records.
+        :rtype: int
+
         Example usage:
         ```
         # Delete multiple records in bulk
@@ -308,9 +576,62 @@ class BaseRepository(Generic[ModelType]):
             MyModel(id=1),
             MyModel(id=2),
         ]
-        await base_repo.bulk_delete(records_to_delete)
-        print(f"{len(records_to_delete)} records deleted in bulk.")
+        deleted = await base_repo.bulk_delete(records_to_delete)
+        print(f"{deleted} records deleted in bulk.")
         ```
         """
-        for entity in entities:
-            await entity.delete()
+        ids = [entity.pk for entity in entities]
+        deleted = 0
+        for start in range(0, len(ids), batch_size):
+            deleted += await self.model_class.filter(
+                pk__in=ids[start : start + batch_size]
+            ).delete()
+        return deleted
+
+    async def _fetch_rows(
+        self, query: QuerySet, only: list[str] | None, row_type: type | None
+    ) -> list:
+        is_model = row_type not in (None, tuple, dict)
+        if only is None:
+            only = (
+                list(row_type.model_fields)
+                if is_model
+                else list(self.model_class._meta.fields_db_projection)
+            )
+
+        if row_type is None or row_type is tuple:
+            return await query.values_list(*only)
+
+        rows = await query.values(*only)
+        if is_model:
+            return [row_type.model_validate(row) for row in rows]
+        return rows
+
+    async def _versioned_update(self, entity: ModelType, values: dict) -> bool:
+        version = getattr(entity, self.version_field)
+        values = {**values, self.version_field: version + 1}
+        updated = await self.model_class.filter(
+            pk=entity.pk, **{self.version_field: version}
+        ).update(**values)
+        if not updated:
+            return False
+
+        for key, value in values.items():
+            setattr(entity, key, value)
+        return True
+
+    def _get_values(self, entity: ModelType) -> dict:
+        meta = self.model_class._meta
+        return {
+            field: getattr(entity, field)
+            for field in meta.fields_db_projection
+            if field not in (meta.pk_attr, self.version_field)
+        }
+
+    def _get_update_fields(self) -> list[str]:
+        meta = self.model_class._meta
+        return [
+            field
+            for field in meta.fields_db_projection
+            if field != meta.pk_attr
+        ]
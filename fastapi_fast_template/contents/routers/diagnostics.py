@@ -0,0 +1,127 @@
+import gc
+import secrets
+import tracemalloc
+from typing import Literal
+
+from config import settings
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
+GroupBy = Literal["lineno", "filename", "traceback"]
+
+snapshots: dict[int, tracemalloc.Snapshot] = {}
+snapshot_filters = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def verify_diagnostics_token(
+    x_diagnostics_token: str = Header(default=""),
+) -> None:
+    if not settings.diagnostics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if not secrets.compare_digest(
+        x_diagnostics_token, settings.diagnostics_token
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+
+diagnostics_router = APIRouter(
+    prefix="/diagnostics",
+    tags=["diagnostics"],
+    include_in_schema=False,
+    dependencies=[Depends(verify_diagnostics_token)],
+)
+
+
+def ensure_tracing() -> None:
+    if not tracemalloc.is_tracing():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="tracemalloc is not started",
+        )
+
+
+def take_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(snapshot_filters)
+
+
+def format_stats(stats: list, limit: int) -> list[dict]:
+    result = []
+    for stat in stats[:limit]:
+        item = {
+            "location": str(stat.traceback),
+            "size": stat.size,
+            "count": stat.count,
+        }
+        if isinstance(stat, tracemalloc.StatisticDiff):
+            item["size_diff"] = stat.size_diff
+            item["count_diff"] = stat.count_diff
+        result.append(item)
+    return result
+
+
+@diagnostics_router.post("/memory/start")
+async def start_tracemalloc(frames: int = 1) -> dict:
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    return {"tracing": True, "frames": tracemalloc.get_traceback_limit()}
+
+
+@diagnostics_router.post("/memory/stop")
+async def stop_tracemalloc() -> dict:
+    tracemalloc.stop()
+    snapshots.clear()
+    return {"tracing": False}
+
+
+@diagnostics_router.post("/memory/snapshots")
+async def create_snapshot() -> dict:
+    ensure_tracing()
+    if len(snapshots) >= settings.diagnostics_max_snapshots:
+        snapshots.pop(min(snapshots))
+
+    snapshot_id = max(snapshots, default=0) + 1
+    snapshots[snapshot_id] = await run_in_threadpool(take_snapshot)
+    current, peak = tracemalloc.get_traced_memory()
+    return {"id": snapshot_id, "current": current, "peak": peak}
+
+
+@diagnostics_router.get("/memory/snapshots/{first}/diff/{second}")
+async def diff_snapshots(
+    first: int,
+    second: int,
+    group_by: GroupBy = "lineno",
+    limit: int = 20,
+) -> list[dict]:
+    if first not in snapshots or second not in snapshots:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    stats = await run_in_threadpool(
+        snapshots[second].compare_to, snapshots[first], group_by
+    )
+    return format_stats(stats, limit)
+
+
+@diagnostics_router.get("/memory/top")
+async def top_allocators(
+    group_by: GroupBy = "lineno", limit: int = 20
+) -> list[dict]:
+    ensure_tracing()
+    snapshot = await run_in_threadpool(take_snapshot)
+    stats = await run_in_threadpool(snapshot.statistics, group_by)
+    return format_stats(stats, limit)
+
+
+@diagnostics_router.get("/memory/gc")
+async def gc_stats() -> dict:
+    return {
+        "enabled": gc.isenabled(),
+        "count": gc.get_count(),
+        "threshold": gc.get_threshold(),
+        "generations": gc.get_stats(),
+        "garbage": len(gc.garbage),
+    }
@@ -1,11 +0,0 @@
-import asyncio
-from collections.abc import Generator
-
-import pytest
-
-
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
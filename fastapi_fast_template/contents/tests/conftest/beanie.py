@@ -0,0 +1,69 @@
+import os
+import sys
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+import pytest_asyncio
+from pymongo.asynchronous.database import AsyncDatabase
+from pytest_asyncio import is_async_test
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from config import settings  # noqa: E402
+from database import mongo_client  # noqa: E402
+
+# Every pytest-xdist worker ("gw0", "gw1", ...) gets its own database, so
+# "pytest -n auto" runs without workers seeing each other's documents.
+WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # The client and its pool live for the whole session, so every test has
+    # to run on the same event loop.
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+def get_test_db_url(db_url: str) -> str:
+    url = urlsplit(db_url)
+    database = url.path.lstrip("/") or "fast"
+    return url._replace(path=f"/{database}_test_{WORKER}").geturl()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db() -> AsyncGenerator[AsyncDatabase, None]:
+    """
+    Connects to the test database of this worker once per session and drops
+    it at the end.
+    """
+    settings.mongo_connection = get_test_db_url(settings.mongo_connection)
+    await mongo_client.start()
+    database = mongo_client.client.get_default_database()
+
+    yield database
+
+    await mongo_client.client.drop_database(database.name)
+    await mongo_client.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def clean_db(
+    db: AsyncDatabase,
+) -> AsyncGenerator[AsyncDatabase, None]:
+    """
+    Empties every collection after the test. MongoDB has no SAVEPOINTs and
+    its transactions need a replica set, so the documents are deleted
+    instead, which keeps the collections and their indexes.
+    """
+    yield db
+
+    collections = await db.list_collection_names(
+        filter={"name": {"$not": {"$regex": r"^system\."}}}
+    )
+    for name in collections:
+        await db[name].delete_many({})
@@ -0,0 +1,128 @@
+import importlib
+import os
+import sys
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from pytest_asyncio import is_async_test
+from sqlalchemy import event, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from config import settings  # noqa: E402
+from database import Base, async_session  # noqa: E402
+
+# Every pytest-xdist worker ("gw0", "gw1", ...) gets its own database, so
+# "pytest -n auto" runs without workers seeing each other's rows.
+WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # The engine and its pool live for the whole session, so every test has
+    # to run on the same event loop.
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+def get_test_db_url(db_url: str) -> URL:
+    url = make_url(db_url)
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            return url
+        path = Path(url.database)
+        return url.set(
+            database=str(path.with_stem(f"{path.stem}_test_{WORKER}"))
+        )
+    return url.set(database=f"{url.database}_test_{WORKER}")
+
+
+async def recreate_database(url: URL, drop_only: bool = False) -> None:
+    if url.get_backend_name() == "sqlite":
+        if url.database not in (None, "", ":memory:"):
+            Path(url.database).unlink(missing_ok=True)
+        return
+
+    engine = create_async_engine(
+        url.set(database="postgres"), isolation_level="AUTOCOMMIT"
+    )
+    async with engine.connect() as connection:
+        await connection.execute(
+            text(f'DROP DATABASE IF EXISTS "{url.database}" WITH (FORCE)')
+        )
+        if not drop_only:
+            await connection.execute(text(f'CREATE DATABASE "{url.database}"'))
+    await engine.dispose()
+
+
+def enable_sqlite_savepoints(engine: AsyncEngine) -> None:
+    # pysqlite emits its own BEGIN/COMMIT, which breaks SAVEPOINT. Let
+    # SQLAlchemy take over the transaction handling instead.
+    @event.listens_for(engine.sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def on_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+def import_models() -> None:
+    for path in sorted((SRC_DIR / "models").rglob("*.py")):
+        module = ".".join(path.relative_to(SRC_DIR).with_suffix("").parts)
+        importlib.import_module(module.removesuffix(".__init__"))
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Creates the test database of this worker and its schema once per session.
+    """
+    url = get_test_db_url(settings.sqlalchemy_db_url)
+    await recreate_database(url)
+    engine = create_async_engine(url)
+    if url.get_backend_name() == "sqlite":
+        enable_sqlite_savepoints(engine)
+
+    import_models()
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+    await recreate_database(url, drop_only=True)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session(
+    db_engine: AsyncEngine,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Runs the test inside a transaction that is rolled back afterwards. Every
+    session of the application (`get_session`, `UnitOfWork`) is bound to the
+    same connection, and their commits only release a SAVEPOINT.
+    """
+    async with db_engine.connect() as connection:
+        transaction = await connection.begin()
+        session_config = async_session.kw.copy()
+        async_session.configure(
+            bind=connection, join_transaction_mode="create_savepoint"
+        )
+        session = async_session()
+        try:
+            yield session
+        finally:
+            await session.close()
+            async_session.kw = session_config
+            await transaction.rollback()
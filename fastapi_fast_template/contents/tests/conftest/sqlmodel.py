@@ -0,0 +1,112 @@
+import importlib
+import os
+import sys
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, event, text
+from sqlalchemy.engine import URL, make_url
+from sqlmodel import Session, SQLModel, create_engine
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from config import settings  # noqa: E402
+from database import sync_session  # noqa: E402
+
+# Every pytest-xdist worker ("gw0", "gw1", ...) gets its own database, so
+# "pytest -n auto" runs without workers seeing each other's rows.
+WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def get_test_db_url(db_url: str) -> URL:
+    url = make_url(db_url)
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            return url
+        path = Path(url.database)
+        return url.set(
+            database=str(path.with_stem(f"{path.stem}_test_{WORKER}"))
+        )
+    return url.set(database=f"{url.database}_test_{WORKER}")
+
+
+def recreate_database(url: URL, drop_only: bool = False) -> None:
+    if url.get_backend_name() == "sqlite":
+        if url.database not in (None, "", ":memory:"):
+            Path(url.database).unlink(missing_ok=True)
+        return
+
+    engine = create_engine(
+        url.set(database="postgres"), isolation_level="AUTOCOMMIT"
+    )
+    with engine.connect() as connection:
+        connection.execute(
+            text(f'DROP DATABASE IF EXISTS "{url.database}" WITH (FORCE)')
+        )
+        if not drop_only:
+            connection.execute(text(f'CREATE DATABASE "{url.database}"'))
+    engine.dispose()
+
+
+def enable_sqlite_savepoints(engine: Engine) -> None:
+    # pysqlite emits its own BEGIN/COMMIT, which breaks SAVEPOINT. Let
+    # SQLAlchemy take over the transaction handling instead.
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def on_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+
+def import_models() -> None:
+    for path in sorted((SRC_DIR / "models").rglob("*.py")):
+        module = ".".join(path.relative_to(SRC_DIR).with_suffix("").parts)
+        importlib.import_module(module.removesuffix(".__init__"))
+
+
+@pytest.fixture(scope="session")
+def db_engine() -> Generator[Engine, None, None]:
+    """
+    Creates the test database of this worker and its schema once per session.
+    """
+    url = get_test_db_url(settings.sqlmodel_db_url)
+    recreate_database(url)
+    if url.get_backend_name() == "sqlite":
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        enable_sqlite_savepoints(engine)
+    else:
+        engine = create_engine(url)
+
+    import_models()
+    SQLModel.metadata.create_all(engine)
+
+    yield engine
+
+    engine.dispose()
+    recreate_database(url, drop_only=True)
+
+
+@pytest.fixture
+def db_session(db_engine: Engine) -> Generator[Session, None, None]:
+    """
+    Runs the test inside a transaction that is rolled back afterwards. Every
+    session of the application (`get_session`, `UnitOfWork`) is bound to the
+    same connection, and their commits only release a SAVEPOINT.
+    """
+    with db_engine.connect() as connection:
+        transaction = connection.begin()
+        session_config = sync_session.kw.copy()
+        sync_session.configure(
+            bind=connection, join_transaction_mode="create_savepoint"
+        )
+        session = sync_session()
+        try:
+            yield session
+        finally:
+            session.close()
+            sync_session.kw = session_config
+            transaction.rollback()
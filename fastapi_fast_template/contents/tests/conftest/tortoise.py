@@ -0,0 +1,77 @@
+import os
+import sys
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+import pytest_asyncio
+from pytest_asyncio import is_async_test
+from tortoise import Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.transactions import in_transaction
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from config import settings  # noqa: E402
+from database import get_tortoise_config  # noqa: E402
+
+# Every pytest-xdist worker ("gw0", "gw1", ...) gets its own database, so
+# "pytest -n auto" runs without workers seeing each other's rows.
+WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+class TransactionRollback(Exception):
+    pass
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # The connections live for the whole session, so every test has to run
+    # on the same event loop.
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+def get_test_db_url(db_url: str) -> str:
+    url = urlsplit(db_url)
+    if url.scheme == "sqlite":
+        if url.path in ("", "/", ":memory:"):
+            return db_url
+        path = Path(url.path)
+        return url._replace(
+            path=str(path.with_stem(f"{path.stem}_test_{WORKER}"))
+        ).geturl()
+    return url._replace(path=f"{url.path}_test_{WORKER}").geturl()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db() -> AsyncGenerator[None, None]:
+    """
+    Creates the test database of this worker and its schema once per session.
+    """
+    settings.tortoise_db_url = get_test_db_url(settings.tortoise_db_url)
+    settings.tortoise_read_db_url = None
+    await Tortoise.init(config=get_tortoise_config(), _create_db=True)
+    await Tortoise.generate_schemas()
+
+    yield
+
+    await Tortoise._drop_databases()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_transaction(db) -> AsyncGenerator[BaseDBAsyncClient, None]:
+    """
+    Runs the test inside a transaction that is rolled back afterwards.
+    Queries of the test use it as the "default" connection, and the
+    `in_transaction()` blocks of the application become SAVEPOINTs.
+    """
+    try:
+        async with in_transaction("default") as connection:
+            yield connection
+            raise TransactionRollback
+    except TransactionRollback:
+        pass
@@ -0,0 +1,91 @@
+from collections import defaultdict
+
+from starlette.responses import JSONResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    from utils.loop_monitor import loop_monitor
+except ImportError:
+    loop_monitor = None
+
+
+class AdmissionControlMiddleware:
+    """
+    Rejects requests with 503 + Retry-After instead of queueing them when the
+    global in-flight cap, a per-route bulkhead or the event loop lag limit is
+    exceeded. A limit of 0 disables the corresponding check.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_in_flight: int = 0,
+        route_limits: dict[str, int] | None = None,
+        default_route_limit: int = 0,
+        max_loop_lag: float = 0.0,
+        retry_after: int = 1,
+    ) -> None:
+        self.app = app
+        self.max_in_flight = max_in_flight
+        self.route_limits = route_limits or {}
+        self.default_route_limit = default_route_limit
+        self.max_loop_lag = max_loop_lag
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.route_in_flight: dict[str, int] = defaultdict(int)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = self.get_route(scope)
+        reason = self.get_rejection_reason(route)
+        if reason is not None:
+            response = JSONResponse(
+                {"detail": reason},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        self.in_flight += 1
+        if route is not None:
+            self.route_in_flight[route] += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+            if route is not None:
+                self.route_in_flight[route] -= 1
+
+    def get_rejection_reason(self, route: str | None) -> str | None:
+        if (
+            self.max_loop_lag
+            and loop_monitor is not None
+            and loop_monitor.lag > self.max_loop_lag
+        ):
+            return "Event loop is overloaded"
+
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            return "Too many requests in flight"
+
+        if route is not None:
+            limit = self.route_limits.get(route, self.default_route_limit)
+            if limit and self.route_in_flight[route] >= limit:
+                return "Too many requests in flight for this route"
+
+        return None
+
+    def get_route(self, scope: Scope) -> str | None:
+        if not self.route_limits and not self.default_route_limit:
+            return None
+
+        app = scope.get("app")
+        for route in getattr(app, "routes", ()):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+        return None
@@ -0,0 +1,253 @@
+import functools
+import inspect
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+
+from config import settings
+
+
+class CircuitBreakerOpenError(Exception):
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(
+            f"Circuit breaker '{name}' is open, retry in {retry_after:.1f}s"
+        )
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitStateEnum(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Trips to OPEN when the failure rate over a rolling `window` (in seconds)
+    reaches `failure_rate_threshold` after at least `minimum_calls` calls.
+    While OPEN, calls fail fast with `CircuitBreakerOpenError`. After
+    `open_duration` seconds up to `half_open_max_calls` probe calls are let
+    through; a successful probe closes the circuit and a failed one reopens it.
+    Calls made while another call of the same breaker is running, like a
+    protected method calling another one, are not counted on their own.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 20,
+        window: float = 30.0,
+        buckets: int = 10,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1,
+        excluded_exceptions: tuple[type[BaseException], ...] = (),
+    ) -> None:
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.bucket_width = window / buckets
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self.excluded_exceptions = excluded_exceptions
+        self.state = CircuitStateEnum.CLOSED
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        self.buckets: deque[list[int]] = deque(maxlen=buckets)
+        self.current_bucket = -1
+        self.in_call: ContextVar[bool] = ContextVar(
+            f"circuit_breaker_{name}_in_call", default=False
+        )
+
+    def __call__(self, func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await self.call(func, *args, **kwargs)
+
+            return wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            return self.call_sync(func, *args, **kwargs)
+
+        return sync_wrapper
+
+    def protect(self, cls: type) -> type:
+        """
+        Class decorator that wraps every public method of `cls`, including the
+        inherited `BaseRepository` ones, with this breaker. Sync methods, like
+        the ones of the SQLModel repositories, are wrapped as well.
+
+        Example usage:
+        ```
+        @db_circuit_breaker.protect
+        class ProductRepository(BaseRepository[Product]):
+            model_class = Product
+        ```
+        """
+        protected = []
+        for name, method in inspect.getmembers(cls, inspect.isfunction):
+            if name.startswith("_") or isinstance(
+                inspect.getattr_static(cls, name), staticmethod
+            ):
+                continue
+            setattr(cls, name, self(method))
+            protected.append(name)
+
+        if not protected:
+            raise TypeError(f"{cls.__name__} has no public method to protect")
+        return cls
+
+    async def call(self, func: Callable, *args, **kwargs):
+        if self.in_call.get():
+            return await func(*args, **kwargs)
+
+        with self.track():
+            return await func(*args, **kwargs)
+
+    def call_sync(self, func: Callable, *args, **kwargs):
+        if self.in_call.get():
+            return func(*args, **kwargs)
+
+        with self.track():
+            return func(*args, **kwargs)
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        self.before_call()
+        token = self.in_call.set(True)
+        try:
+            yield
+        except self.excluded_exceptions:
+            self.record_success()
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        finally:
+            self.in_call.reset(token)
+        self.record_success()
+
+    def before_call(self) -> None:
+        now = time.monotonic()
+        if self.state == CircuitStateEnum.OPEN:
+            retry_after = self.opened_at + self.open_duration - now
+            if retry_after > 0:
+                raise CircuitBreakerOpenError(self.name, retry_after)
+            self.state = CircuitStateEnum.HALF_OPEN
+            self.half_open_calls = 0
+
+        if self.state == CircuitStateEnum.HALF_OPEN:
+            if self.half_open_calls >= self.half_open_max_calls:
+                raise CircuitBreakerOpenError(self.name, self.open_duration)
+            self.half_open_calls += 1
+
+    def record_success(self) -> None:
+        if self.state == CircuitStateEnum.HALF_OPEN:
+            self.close()
+            return
+        self.get_bucket()[0] += 1
+
+    def record_failure(self) -> None:
+        if self.state == CircuitStateEnum.HALF_OPEN:
+            self.open()
+            return
+
+        self.get_bucket()[1] += 1
+        calls = sum(sum(bucket) for bucket in self.buckets)
+        failures = sum(bucket[1] for bucket in self.buckets)
+        if (
+            calls >= self.minimum_calls
+            and failures / calls >= self.failure_rate_threshold
+        ):
+            self.open()
+
+    def release(self) -> None:
+        if self.state == CircuitStateEnum.HALF_OPEN:
+            self.half_open_calls = max(0, self.half_open_calls - 1)
+
+    def open(self) -> None:
+        self.state = CircuitStateEnum.OPEN
+        self.opened_at = time.monotonic()
+
+    def close(self) -> None:
+        self.state = CircuitStateEnum.CLOSED
+        self.buckets.clear()
+        self.current_bucket = -1
+
+    def get_bucket(self) -> list[int]:
+        bucket = int(time.monotonic() / self.bucket_width)
+        if bucket != self.current_bucket:
+            missed = min(bucket - self.current_bucket, self.buckets.maxlen)
+            for _ in range(missed):
+                self.buckets.append([0, 0])
+            self.current_bucket = bucket
+        return self.buckets[-1]
+
+
+class RetryBudget:
+    """
+    Allows retries only while they stay under `ratio` of the calls made in the
+    last `window` seconds (with a floor of `min_retries_per_second`), so
+    retries cannot multiply the load on a dependency that is already failing.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        window: float = 10.0,
+        min_retries_per_second: float = 1.0,
+    ) -> None:
+        self.ratio = ratio
+        self.window = window
+        self.min_retries = min_retries_per_second * window
+        self.calls: deque[float] = deque()
+        self.retries: deque[float] = deque()
+
+    def record_call(self) -> None:
+        now = time.monotonic()
+        self.prune(now)
+        self.calls.append(now)
+
+    def try_retry(self) -> bool:
+        now = time.monotonic()
+        self.prune(now)
+        if len(self.retries) >= max(
+            self.min_retries, self.ratio * len(self.calls)
+        ):
+            return False
+        self.retries.append(now)
+        return True
+
+    def prune(self, now: float) -> None:
+        for timestamps in (self.calls, self.retries):
+            while timestamps and timestamps[0] < now - self.window:
+                timestamps.popleft()
+
+
+def get_circuit_breaker(
+    name: str,
+    excluded_exceptions: tuple[type[BaseException], ...] = (),
+) -> CircuitBreaker:
+    return CircuitBreaker(
+        name,
+        failure_rate_threshold=settings.circuit_breaker_failure_rate,
+        minimum_calls=settings.circuit_breaker_minimum_calls,
+        window=settings.circuit_breaker_window,
+        open_duration=settings.circuit_breaker_open_duration,
+        half_open_max_calls=settings.circuit_breaker_half_open_calls,
+        excluded_exceptions=excluded_exceptions,
+    )
+
+
+http_circuit_breaker = get_circuit_breaker("http")
+http_retry_budget = RetryBudget(ratio=settings.retry_budget_ratio)
@@ -0,0 +1,118 @@
+import asyncio
+from collections.abc import Callable, Iterable
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DEFAULT_VARY_HEADERS = (
+    "accept",
+    "accept-encoding",
+    "accept-language",
+    "authorization",
+    "cookie",
+)
+
+
+def single_flight(vary_headers: Iterable[str] = DEFAULT_VARY_HEADERS):
+    """
+    Marks a GET endpoint whose concurrent identical requests (same path, query
+    and `vary_headers`) are served by a single handler execution.
+
+    Example usage:
+    ```
+    @router.get("/products")
+    @single_flight(vary_headers=("accept-language",))
+    async def list_products(): ...
+    ```
+    """
+
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__single_flight__ = tuple(
+            header.lower().encode() for header in vary_headers
+        )
+        return endpoint
+
+    return decorator
+
+
+class SingleFlightMiddleware:
+    """
+    Collapses concurrent identical GET requests to `single_flight` endpoints
+    into one handler execution and replays the rendered response to every
+    waiter. If the leading request fails, each waiter runs the handler itself.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.in_flight: dict[tuple, asyncio.Future] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        vary_headers = self.get_vary_headers(scope)
+        if vary_headers is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        key = (
+            scope["path"],
+            scope["query_string"],
+            tuple(headers.get(header) for header in vary_headers),
+        )
+
+        future = self.in_flight.get(key)
+        if future is not None:
+            messages = await asyncio.shield(future)
+            if messages is None:
+                await self.app(scope, receive, send)
+                return
+            for message in messages:
+                await send(self.copy_message(message))
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[key] = future
+        messages: list[Message] = []
+
+        async def send_and_capture(message: Message) -> None:
+            # Outer middlewares rewrite the headers in place, so waiters get
+            # copies of the messages as the handler sent them.
+            messages.append(self.copy_message(message))
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                self.release(key, future, messages)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_capture)
+        finally:
+            self.release(key, future, None)
+
+    def release(
+        self,
+        key: tuple,
+        future: asyncio.Future,
+        messages: list[Message] | None,
+    ) -> None:
+        if future.done():
+            return
+        future.set_result(messages)
+        if self.in_flight.get(key) is future:
+            del self.in_flight[key]
+
+    def copy_message(self, message: Message) -> Message:
+        if "headers" not in message:
+            return {**message}
+        return {**message, "headers": list(message["headers"])}
+
+    def get_vary_headers(self, scope: Scope) -> tuple[bytes, ...] | None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return None
+
+        app = scope.get("app")
+        for route in getattr(app, "routes", ()):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                endpoint = getattr(route, "endpoint", None)
+                return getattr(endpoint, "__single_flight__", None)
+        return None
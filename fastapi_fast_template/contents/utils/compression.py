@@ -0,0 +1,178 @@
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+EXCLUDED_CONTENT_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "text/event-stream",
+    "application/gzip",
+    "application/zip",
+    "application/zstd",
+    "application/x-brotli",
+    "application/octet-stream",
+)
+
+
+class Compressor:
+    def __init__(self, encoding: str, level: int) -> None:
+        self.encoding = encoding
+        if encoding == "zstd":
+            compressor = zstandard.ZstdCompressor(level=level)
+            self.compressor = compressor.compressobj()
+        elif encoding == "br":
+            self.compressor = brotli.Compressor(quality=level)
+        else:
+            self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self.compressor.process(data) + self.compressor.flush()
+        if self.encoding == "zstd":
+            return self.compressor.compress(data) + self.compressor.flush(
+                zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            )
+        return self.compressor.compress(data) + self.compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self.compressor.finish()
+        return self.compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with zstd, brotli or gzip, negotiated through the
+    Accept-Encoding header. Bodies smaller than `minimum_size` and content
+    types that are already compressed are sent as-is. Streaming responses are
+    compressed chunk by chunk without being buffered.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {
+            "gzip": gzip_level,
+            "br": brotli_quality,
+            "zstd": zstd_level,
+        }
+        self.available_encodings = ["gzip"]
+        if brotli is not None:
+            self.available_encodings.insert(0, "br")
+        if zstandard is not None:
+            self.available_encodings.insert(0, "zstd")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        encoding = None
+        if scope["type"] == "http":
+            encoding = self.negotiate(
+                Headers(scope=scope).get("accept-encoding", "")
+            )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        compressor: Compressor | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                passthrough = not self.is_compressible(message)
+                if passthrough:
+                    await send(message)
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            headers = MutableHeaders(raw=start_message["headers"])
+
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = Compressor(encoding, self.levels[encoding])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    body = compressor.compress(body) + compressor.finish()
+                    headers["Content-Length"] = str(len(body))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(start_message)
+
+            body = compressor.compress(body)
+            if not more_body:
+                body += compressor.finish()
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": body,
+                    "more_body": more_body,
+                }
+            )
+
+        await self.app(scope, receive, send_compressed)
+
+    def negotiate(self, accept_encoding: str) -> str | None:
+        accepted = {}
+        for item in accept_encoding.lower().split(","):
+            name, _, params = item.strip().partition(";")
+            quality = 1.0
+            if params.strip().startswith("q="):
+                try:
+                    quality = float(params.strip()[2:])
+                except ValueError:
+                    quality = 0.0
+            accepted[name.strip()] = quality
+
+        qualities = {
+            encoding: accepted.get(encoding, accepted.get("*", 0.0))
+            for encoding in self.available_encodings
+        }
+        encoding = max(self.available_encodings, key=qualities.get)
+        return encoding if qualities[encoding] > 0 else None
+
+    def is_compressible(self, message: Message) -> bool:
+        headers = Headers(raw=message["headers"])
+        if message["status"] < 200 or message["status"] in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return not content_type.startswith(EXCLUDED_CONTENT_TYPES)
@@ -0,0 +1,154 @@
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Headers a 304 repeats from the 200 it stands for (RFC 9110, 15.4.5), so
+# caches keep the freshness and variant information of the response.
+NOT_MODIFIED_HEADERS = ("cache-control", "content-location", "expires", "vary")
+
+
+def make_etag(*parts) -> str:
+    """
+    Builds a weak ETag from cheap validators such as the entity id and its
+    version or `updated_at` column, so the body never has to be hashed.
+    """
+    digest = hashlib.blake2b(
+        "|".join(map(str, parts)).encode(), digest_size=16
+    )
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque_tag
+        for tag in if_none_match.split(",")
+    )
+
+
+def check_etag(
+    request: Request, response: Response, *parts
+) -> Response | None:
+    """
+    Sets the ETag header on `response` and returns a 304 response when the
+    client already has the current representation.
+
+    Example usage:
+    ```
+    @router.get("/products/{id}")
+    async def get_product(id: int, request: Request, response: Response):
+        version = await product_repo.get_version(id)
+        if not_modified := check_etag(request, response, id, version):
+            return not_modified
+        return await product_repo.get_by_id(id)
+    ```
+    """
+    etag = make_etag(*parts)
+    response.headers["ETag"] = etag
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name in NOT_MODIFIED_HEADERS
+        }
+        headers["ETag"] = etag
+        return Response(status_code=304, headers=headers)
+    return None
+
+
+class ETagMiddleware:
+    """
+    Adds a weak ETag to GET/HEAD 200 responses that do not set one by hashing
+    bodies up to `max_body_size` bytes, and answers a matching If-None-Match
+    with 304. Streaming bodies larger than the limit are passed through.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int = 1_048_576) -> None:
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: Message | None = None
+        body_messages: list[Message] = []
+        body_size = 0
+        buffering = True
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start_message, body_size, buffering
+
+            if not buffering:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                etag = Headers(raw=message["headers"]).get("etag")
+                if message["status"] != 200:
+                    buffering = False
+                    await send(message)
+                elif etag is not None and etag_matches(if_none_match, etag):
+                    start_message = self.not_modified_message(message, etag)
+                elif etag is not None:
+                    buffering = False
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if start_message["status"] == 304:
+                if not message.get("more_body", False):
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": b""})
+                return
+
+            body_messages.append(message)
+            body_size += len(message.get("body", b""))
+            if body_size > self.max_body_size:
+                buffering = False
+                await send(start_message)
+                for body_message in body_messages:
+                    await send(body_message)
+                return
+
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(item.get("body", b"") for item in body_messages)
+            etag = make_etag(hashlib.blake2b(body).hexdigest())
+            if etag_matches(if_none_match, etag):
+                start_message = self.not_modified_message(start_message, etag)
+                body = b""
+            else:
+                MutableHeaders(raw=start_message["headers"])["ETag"] = etag
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
+
+    def not_modified_message(
+        self, start_message: Message, etag: str
+    ) -> Message:
+        headers = [
+            (name, value)
+            for name, value in start_message["headers"]
+            if name.decode("latin-1").lower() in NOT_MODIFIED_HEADERS
+        ]
+        headers.append((b"etag", etag.encode("latin-1")))
+        return {
+            "type": "http.response.start",
+            "status": 304,
+            "headers": headers,
+        }
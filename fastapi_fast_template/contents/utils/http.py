@@ -0,0 +1,162 @@
+import asyncio
+import random
+
+import httpx
+from config import settings
+
+try:
+    from utils.circuit_breaker import http_circuit_breaker, http_retry_budget
+except ModuleNotFoundError as exc:
+    # The circuit_breaker extension is not added.
+    if exc.name != "utils.circuit_breaker":
+        raise
+    http_circuit_breaker = http_retry_budget = None
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """
+    Retries failed connection attempts, and transport errors or 502/503/504
+    responses of idempotent requests, with exponential backoff and full jitter.
+    When given, `circuit_breaker` fails calls fast while the downstream is
+    unhealthy and `retry_budget` caps the share of retried calls.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retries: int = 2,
+        backoff: float = 0.1,
+        max_backoff: float = 2.0,
+        circuit_breaker=None,
+        retry_budget=None,
+    ) -> None:
+        self.transport = transport
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        if self.retry_budget is not None:
+            self.retry_budget.record_call()
+
+        attempt = 0
+        while True:
+            try:
+                response = await self.send(request)
+            except httpx.TransportError as exc:
+                if not self.should_retry(request, attempt, exc):
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or (
+                    not self.should_retry(request, attempt)
+                ):
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(self.get_backoff(attempt))
+            attempt += 1
+
+    async def send(self, request: httpx.Request) -> httpx.Response:
+        if self.circuit_breaker is None:
+            return await self.transport.handle_async_request(request)
+
+        self.circuit_breaker.before_call()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except httpx.TransportError:
+            self.circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            self.circuit_breaker.release()
+            raise
+
+        if response.status_code in RETRY_STATUS_CODES:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        return response
+
+    def should_retry(
+        self,
+        request: httpx.Request,
+        attempt: int,
+        exc: httpx.TransportError | None = None,
+    ) -> bool:
+        if attempt >= self.retries:
+            return False
+        if not isinstance(
+            exc, (httpx.ConnectError, httpx.ConnectTimeout)
+        ) and (request.method not in IDEMPOTENT_METHODS):
+            return False
+        return self.retry_budget is None or self.retry_budget.try_retry()
+
+    def get_backoff(self, attempt: int) -> float:
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff * 2**attempt)
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class HTTPClient:
+    """
+    Holds one pooled `httpx.AsyncClient` for the whole application, so
+    outbound calls reuse connections instead of paying the TCP and TLS
+    handshake on every request.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+
+    async def start(self) -> None:
+        if self._client is not None:
+            return
+
+        transport = httpx.AsyncHTTPTransport(
+            http2=settings.http_http2,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+        )
+        self._client = httpx.AsyncClient(
+            transport=RetryTransport(
+                transport,
+                retries=settings.http_retries,
+                backoff=settings.http_retry_backoff,
+                max_backoff=settings.http_retry_max_backoff,
+                circuit_breaker=http_circuit_breaker,
+                retry_budget=http_retry_budget,
+            ),
+            timeout=httpx.Timeout(
+                settings.http_timeout,
+                connect=settings.http_connect_timeout,
+            ),
+        )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            raise RuntimeError("The HTTP client has not been started")
+        return self._client
+
+
+http_client = HTTPClient()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    return http_client.client
@@ -0,0 +1,180 @@
+import ast
+import importlib
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+SOURCE_DIR = Path(__file__).resolve().parent.parent
+FILTER_METHODS = frozenset(
+    {"filter_by", "filter_for_update", "count", "exists", "get_page"}
+)
+NON_FILTER_KWARGS = frozenset(
+    {
+        "query",
+        "q_filters",
+        "only",
+        "row_type",
+        "options",
+        "prefetch",
+        "fetch_links",
+        "estimated",
+        "limit",
+        "skip_locked",
+        "nowait",
+        "after",
+        "after_id",
+        "sort_field",
+        "descending",
+    }
+)
+
+
+@dataclass(frozen=True)
+class MissingIndex:
+    table: str
+    columns: tuple[str, ...]
+    reason: str
+    name: str | None = None
+    unique: bool = False
+
+    def get_name(self) -> str:
+        return self.name or f"ix_{self.table}_{'_'.join(self.columns)}"
+
+    def to_sql(self) -> str:
+        unique = "UNIQUE " if self.unique else ""
+        return (
+            f"CREATE {unique}INDEX CONCURRENTLY IF NOT EXISTS "
+            f"{self.get_name()} ON {self.table} ({', '.join(self.columns)});"
+        )
+
+
+def import_models() -> None:
+    """
+    Imports every module of the "models" package, so that all models are
+    registered before they are introspected.
+    """
+    for path in sorted((SOURCE_DIR / "models").rglob("*.py")):
+        module = ".".join(path.relative_to(SOURCE_DIR).with_suffix("").parts)
+        importlib.import_module(module.removesuffix(".__init__"))
+
+
+def get_subclasses(cls: type) -> list[type]:
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(get_subclasses(subclass))
+    return subclasses
+
+
+def get_filtered_fields() -> dict[str, set[str]]:
+    """
+    Maps model class names to the fields their repositories filter on, taken
+    from the keyword arguments of `filter_by`, `count`, `exists`, ... calls.
+    Calls are attributed to a repository when made on `self` inside it, on
+    `SomeRepository(...)`, or on a name assigned or annotated with it.
+    """
+    trees = [
+        ast.parse(path.read_text(), filename=str(path))
+        for path in SOURCE_DIR.rglob("*.py")
+    ]
+    repositories = {}
+    for tree in trees:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                model_name = get_model_name(node)
+                if model_name is not None:
+                    repositories[node.name] = model_name
+
+    fields = defaultdict(set)
+    for tree in trees:
+        for repository, call in iter_filter_calls(tree, repositories):
+            for keyword in call.keywords:
+                if keyword.arg and keyword.arg not in NON_FILTER_KWARGS:
+                    field = keyword.arg.split("__")[0]
+                    fields[repositories[repository]].add(field)
+    return fields
+
+
+def get_model_name(node: ast.ClassDef) -> str | None:
+    for statement in node.body:
+        if isinstance(statement, ast.Assign):
+            targets = statement.targets
+        elif isinstance(statement, ast.AnnAssign):
+            targets = [statement.target]
+        else:
+            continue
+        if any(
+            isinstance(target, ast.Name) and target.id == "model_class"
+            for target in targets
+        ) and isinstance(statement.value, ast.Name):
+            return statement.value.id
+    return None
+
+
+def iter_filter_calls(tree: ast.AST, repositories: dict[str, str]):
+    names = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+            repository = get_called_name(node.value)
+            for target in node.targets:
+                if isinstance(target, ast.Name) and repository in repositories:
+                    names[target.id] = repository
+        elif isinstance(node, (ast.arg, ast.AnnAssign)):
+            annotation = node.annotation
+            target = node.arg if isinstance(node, ast.arg) else None
+            if isinstance(node, ast.AnnAssign) and isinstance(
+                node.target, ast.Name
+            ):
+                target = node.target.id
+            if (
+                target is not None
+                and isinstance(annotation, ast.Name)
+                and annotation.id in repositories
+            ):
+                names[target] = annotation.id
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if node.name in repositories:
+            for call in iter_calls(node):
+                if (
+                    isinstance(call.func.value, ast.Name)
+                    and call.func.value.id == "self"
+                ):
+                    yield node.name, call
+
+    for call in iter_calls(tree):
+        receiver = call.func.value
+        if isinstance(receiver, ast.Call):
+            repository = get_called_name(receiver)
+        elif isinstance(receiver, ast.Name):
+            repository = names.get(receiver.id)
+        else:
+            repository = None
+        if repository in repositories:
+            yield repository, call
+
+
+def iter_calls(tree: ast.AST):
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in FILTER_METHODS
+        ):
+            yield node
+
+
+def get_called_name(call: ast.Call) -> str | None:
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    return None
+
+
+def is_covered(column: str, indexes: list[tuple[str, ...]]) -> bool:
+    """
+    A column is covered by an index when it is the leading column of it, which
+    is the only position a B-tree can seek on.
+    """
+    return any(index and index[0] == column for index in indexes)
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import logging
+
+from beanie import Document
+from beanie.exceptions import CollectionWasNotInitialized
+from config import settings
+from database import mongo_client
+
+from utils.index_usage import (
+    MissingIndex,
+    get_filtered_fields,
+    get_subclasses,
+    import_models,
+    is_covered,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_index_keys(index) -> tuple[tuple[str, int], ...]:
+    if isinstance(index, str):
+        return ((index, 1),)
+    if hasattr(index, "document"):
+        return tuple(index.document["key"].items())
+    return tuple(index)
+
+
+def get_declared_indexes(model) -> list[tuple[tuple[str, int], ...]]:
+    indexes = model.get_settings().indexes or []
+    declared = [get_index_keys(index) for index in indexes]
+    for name, field in model.model_fields.items():
+        markers = [field.annotation, *field.metadata]
+        indexed = next(
+            (
+                marker._indexed
+                for marker in markers
+                if hasattr(marker, "_indexed")
+            ),
+            None,
+        )
+        if indexed is not None:
+            declared.append(((field.alias or name, indexed[0]),))
+    return declared
+
+
+def to_command(index: MissingIndex) -> str:
+    keys = json.dumps(dict.fromkeys(index.columns, 1))
+    return f"db.{index.table}.createIndex({keys})"
+
+
+async def get_missing_indexes() -> list[MissingIndex]:
+    """
+    Compares the indexes declared on the documents (`Indexed` fields and
+    `Settings.indexes`) and the fields filtered on by repositories with the
+    indexes of the live collections.
+    """
+    import_models()
+    filtered_fields = get_filtered_fields()
+    missing = []
+    for model in get_subclasses(Document):
+        try:
+            collection = model.get_pymongo_collection()
+        except CollectionWasNotInitialized:
+            # Documents that were not passed to init_beanie
+            continue
+
+        information = await collection.index_information()
+        live_indexes = [
+            tuple(field for field, _ in index["key"])
+            for index in information.values()
+        ]
+        declared = get_declared_indexes(model)
+        for keys in declared:
+            fields = tuple(field for field, _ in keys)
+            if fields not in live_indexes:
+                missing.append(
+                    MissingIndex(
+                        table=collection.name,
+                        columns=fields,
+                        reason="declared on the document",
+                    )
+                )
+
+        indexes = live_indexes + [
+            tuple(field for field, _ in keys) for keys in declared
+        ]
+        for field in sorted(filtered_fields.get(model.__name__, ())):
+            field = "_id" if field == "id" else field
+            if not is_covered(field, indexes):
+                missing.append(
+                    MissingIndex(
+                        table=collection.name,
+                        columns=(field,),
+                        reason=f"filtered on by {model.__name__} repositories",
+                    )
+                )
+    return missing
+
+
+async def check_indexes() -> None:
+    """
+    Logs the missing indexes at startup. Only runs in debug mode, so
+    production startups never pay for the introspection.
+    """
+    if not settings.debug:
+        return
+    try:
+        missing = await get_missing_indexes()
+    except Exception as exc:
+        logger.warning("Skipped the index check: %s", exc)
+        return
+    for index in missing:
+        logger.warning(
+            "Missing index on %s(%s), %s: %s",
+            index.table,
+            ", ".join(index.columns),
+            index.reason,
+            to_command(index),
+        )
+
+
+async def main() -> None:
+    await mongo_client.start()
+    try:
+        missing = await get_missing_indexes()
+    finally:
+        await mongo_client.close()
+    if not missing:
+        print("All declared and filtered fields are indexed.")
+        return
+
+    print("// Index builds do not block reads and writes since MongoDB 4.2.")
+    for index in missing:
+        print(f"// {index.reason}")
+        print(to_command(index))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
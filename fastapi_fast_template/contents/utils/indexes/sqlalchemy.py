@@ -0,0 +1,132 @@
+import asyncio
+import logging
+
+from config import settings
+from database import Base, engine
+from sqlalchemy import inspect
+
+from utils.index_usage import (
+    MissingIndex,
+    get_filtered_fields,
+    get_subclasses,
+    import_models,
+    is_covered,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_live_indexes(connection) -> dict[str, list[tuple[str, ...]]]:
+    inspector = inspect(connection)
+    indexes = {}
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name, schema=table.schema):
+            continue
+        columns = [
+            tuple(index["column_names"])
+            for index in inspector.get_indexes(table.name, schema=table.schema)
+        ]
+        columns.extend(
+            tuple(constraint["column_names"])
+            for constraint in inspector.get_unique_constraints(
+                table.name, schema=table.schema
+            )
+        )
+        primary_key = inspector.get_pk_constraint(
+            table.name, schema=table.schema
+        )
+        columns.append(tuple(primary_key["constrained_columns"]))
+        indexes[table.fullname] = columns
+    return indexes
+
+
+async def get_missing_indexes() -> list[MissingIndex]:
+    """
+    Compares the indexes declared on the models (`index=True`, `Index(...)` in
+    `__table_args__`) and the columns filtered on by repositories with the
+    indexes of the live database.
+    """
+    import_models()
+    async with engine.connect() as connection:
+        live_indexes = await connection.run_sync(get_live_indexes)
+
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if table.fullname not in live_indexes:
+            continue
+        for index in table.indexes:
+            columns = tuple(column.name for column in index.columns)
+            if columns not in live_indexes[table.fullname]:
+                missing.append(
+                    MissingIndex(
+                        table=table.fullname,
+                        columns=columns,
+                        reason="declared on the model",
+                        name=index.name,
+                        unique=index.unique,
+                    )
+                )
+
+    models = {model.__name__: model for model in get_subclasses(Base)}
+    for model_name, fields in get_filtered_fields().items():
+        model = models.get(model_name)
+        if model is None or not hasattr(model, "__table__"):
+            continue
+        table = model.__table__
+        if table.fullname not in live_indexes:
+            continue
+        indexes = live_indexes[table.fullname] + [
+            tuple(column.name for column in index.columns)
+            for index in table.indexes
+        ]
+        for field in sorted(fields):
+            column = model.__mapper__.columns.get(field)
+            if column is not None and not is_covered(column.name, indexes):
+                missing.append(
+                    MissingIndex(
+                        table=table.fullname,
+                        columns=(column.name,),
+                        reason=f"filtered on by {model_name} repositories",
+                    )
+                )
+    return missing
+
+
+async def check_indexes() -> None:
+    """
+    Logs the missing indexes at startup. Only runs in debug mode, so
+    production startups never pay for the introspection.
+    """
+    if not settings.debug:
+        return
+    try:
+        missing = await get_missing_indexes()
+    except Exception as exc:
+        logger.warning("Skipped the index check: %s", exc)
+        return
+    for index in missing:
+        logger.warning(
+            "Missing index on %s(%s), %s: %s",
+            index.table,
+            ", ".join(index.columns),
+            index.reason,
+            index.to_sql(),
+        )
+
+
+async def main() -> None:
+    missing = await get_missing_indexes()
+    await engine.dispose()
+    if not missing:
+        print("All declared and filtered columns are indexed.")
+        return
+
+    print("-- Run outside a transaction block, CONCURRENTLY cannot run")
+    print("-- inside one (in Alembic: op.get_context().autocommit_block()).")
+    for index in missing:
+        print(f"-- {index.reason}")
+        print(index.to_sql())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+
+from config import settings
+from database import close_db, init_db
+from tortoise import Tortoise
+from tortoise.connection import connections
+
+from utils.index_usage import MissingIndex, get_filtered_fields, is_covered
+
+logger = logging.getLogger(__name__)
+
+LIVE_INDEXES_QUERY = """
+SELECT t.relname AS table_name,
+       array_agg(a.attname ORDER BY k.position) AS columns
+FROM pg_index x
+JOIN pg_class t ON t.oid = x.indrelid
+CROSS JOIN LATERAL unnest(x.indkey) WITH ORDINALITY AS k(attnum, position)
+JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+WHERE t.relnamespace = 'public'::regnamespace
+GROUP BY t.relname, x.indexrelid
+"""
+
+
+def get_column(model, field_name: str) -> str | None:
+    projection = model._meta.fields_db_projection
+    return projection.get(field_name) or projection.get(f"{field_name}_id")
+
+
+def get_declared_indexes(model) -> list[tuple[tuple[str, ...], bool]]:
+    meta = model._meta
+    declared = []
+    for name, field in meta.fields_map.items():
+        column = get_column(model, name)
+        if column is None or field.pk:
+            continue
+        if field.index or field.unique:
+            declared.append(((column,), field.unique))
+    for fields in meta.unique_together:
+        declared.append((tuple(get_column(model, f) for f in fields), True))
+    for index in meta.indexes:
+        fields = getattr(index, "fields", index) or ()
+        declared.append((tuple(get_column(model, f) for f in fields), False))
+    return [
+        (columns, unique)
+        for columns, unique in declared
+        if columns and all(columns)
+    ]
+
+
+async def get_missing_indexes() -> list[MissingIndex]:
+    """
+    Compares the indexes declared on the models (`index=True`, `unique=True`,
+    `Meta.indexes`, `Meta.unique_together`) and the fields filtered on by
+    repositories with the indexes of the live database.
+    """
+    rows = await connections.get("default").execute_query_dict(
+        LIVE_INDEXES_QUERY
+    )
+    live_indexes = {}
+    for row in rows:
+        live_indexes.setdefault(row["table_name"], []).append(
+            tuple(row["columns"])
+        )
+
+    models = {}
+    for app in Tortoise.apps.values():
+        models.update(app)
+
+    missing = []
+    filtered_fields = get_filtered_fields()
+    for model_name, model in models.items():
+        table = model._meta.db_table
+        if table not in live_indexes:
+            continue
+        declared = get_declared_indexes(model)
+        for columns, unique in declared:
+            if columns not in live_indexes[table]:
+                missing.append(
+                    MissingIndex(
+                        table=table,
+                        columns=columns,
+                        reason="declared on the model",
+                        unique=unique,
+                    )
+                )
+
+        indexes = live_indexes[table] + [columns for columns, _ in declared]
+        for field in sorted(filtered_fields.get(model_name, ())):
+            column = get_column(model, field)
+            if column is not None and not is_covered(column, indexes):
+                missing.append(
+                    MissingIndex(
+                        table=table,
+                        columns=(column,),
+                        reason=f"filtered on by {model_name} repositories",
+                    )
+                )
+    return missing
+
+
+async def check_indexes() -> None:
+    """
+    Logs the missing indexes at startup. Only runs in debug mode, so
+    production startups never pay for the introspection.
+    """
+    if not settings.debug:
+        return
+    try:
+        missing = await get_missing_indexes()
+    except Exception as exc:
+        logger.warning("Skipped the index check: %s", exc)
+        return
+    for index in missing:
+        logger.warning(
+            "Missing index on %s(%s), %s: %s",
+            index.table,
+            ", ".join(index.columns),
+            index.reason,
+            index.to_sql(),
+        )
+
+
+async def main() -> None:
+    await init_db()
+    try:
+        missing = await get_missing_indexes()
+    finally:
+        await close_db()
+    if not missing:
+        print("All declared and filtered fields are indexed.")
+        return
+
+    print("-- Run outside a transaction block, CONCURRENTLY cannot run")
+    print("-- inside one.")
+    for index in missing:
+        print(f"-- {index.reason}")
+        print(index.to_sql())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from config import settings
+from prometheus_client import Gauge, Histogram
+
+logger = logging.getLogger("loop_monitor")
+
+LOOP_LAG = Gauge(
+    "event_loop_lag_seconds",
+    "Delay between the scheduled and the actual wake-up of the event loop.",
+)
+LOOP_LAG_HISTOGRAM = Histogram(
+    "event_loop_lag_distribution_seconds",
+    "Distribution of the event loop scheduling lag.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+
+class LoopMonitor:
+    """
+    Measures event loop scheduling lag at a fixed interval.
+
+    In debug mode a watchdog thread pings the loop and, when a callback holds
+    it longer than `block_threshold` seconds, logs the stack of that callback.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        block_threshold: float = 0.1,
+        detect_blocking: bool = False,
+    ) -> None:
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.detect_blocking = detect_blocking
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._stopped.clear()
+        self._task = loop.create_task(self._measure())
+        if self.detect_blocking:
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(loop, threading.get_ident()),
+                name="loop-monitor-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=self.block_threshold * 2)
+            self._watchdog = None
+
+    async def _measure(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started_at = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag = max(0.0, loop.time() - started_at - self.interval)
+            self.max_lag = max(self.max_lag, self.lag)
+            LOOP_LAG.set(self.lag)
+            LOOP_LAG_HISTOGRAM.observe(self.lag)
+
+    def _watch(
+        self, loop: asyncio.AbstractEventLoop, loop_thread_id: int
+    ) -> None:
+        while not self._stopped.is_set() and not loop.is_closed():
+            answered = threading.Event()
+            try:
+                loop.call_soon_threadsafe(answered.set)
+            except RuntimeError:
+                return
+
+            if answered.wait(self.block_threshold):
+                self._stopped.wait(self.block_threshold)
+                continue
+
+            blocked_at = time.monotonic() - self.block_threshold
+            frame = sys._current_frames().get(loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            answered.wait()
+            logger.warning(
+                "Event loop was blocked for %.3fs by:\n%s",
+                time.monotonic() - blocked_at,
+                stack,
+            )
+
+
+loop_monitor = LoopMonitor(
+    interval=settings.loop_monitor_interval,
+    block_threshold=settings.loop_monitor_block_threshold,
+    detect_blocking=settings.debug,
+)
@@ -0,0 +1,41 @@
+from typing import Any
+
+from config import settings
+from faststream.kafka import KafkaBroker
+from faststream.kafka.exceptions import BatchBufferOverflowException
+
+from utils.buffered_publisher import BufferedPublisher
+
+
+class KafkaPublisher(BufferedPublisher):
+    """
+    Publishes the buffered messages of a topic as Kafka batches.
+    """
+
+    broker: KafkaBroker
+
+    async def _send(self, topic: str, messages: list[Any]) -> None:
+        while messages:
+            try:
+                await self.broker.publish_batch(*messages, topic=topic)
+                return
+            except BatchBufferOverflowException as exc:
+                # The messages do not fit in one batch of `max_batch_size`
+                # bytes, send the ones that do first.
+                if not exc.message_position:
+                    raise
+                await self.broker.publish_batch(
+                    *messages[: exc.message_position], topic=topic
+                )
+                messages = messages[exc.message_position :]
+
+
+publisher = KafkaPublisher(
+    KafkaBroker(
+        settings.broker_url,
+        compression_type=settings.publisher_compression,
+        max_batch_size=settings.publisher_max_batch_bytes,
+    ),
+    max_size=settings.publisher_max_size,
+    linger_ms=settings.publisher_linger_ms,
+)
@@ -0,0 +1,141 @@
+import asyncio
+import contextlib
+import gzip
+import logging
+from collections import defaultdict
+from collections.abc import Awaitable, Iterable
+from typing import Any
+
+from faststream.message import StreamMessage, encode_message
+
+logger = logging.getLogger("publisher")
+
+
+class BufferedPublisher:
+    """
+    Buffers messages per topic (channel, queue or subject) in memory and
+    sends them together when `max_size` messages are waiting for a topic, or
+    `linger_ms` after the first of them, so request handlers do not wait for
+    the broker. Subclasses send a flushed buffer in `_send`.
+
+    Buffered messages are lost if the process is killed before they are
+    flushed, publish the ones that must not be lost with `broker.publish`.
+    With gzip compression the subscribers need the `decompress` decoder.
+    """
+
+    def __init__(
+        self,
+        broker: Any,
+        max_size: int = 500,
+        linger_ms: int = 50,
+        compression: str | None = None,
+    ) -> None:
+        if compression not in (None, "gzip"):
+            raise ValueError(f"Unsupported compression: {compression}")
+
+        self.broker = broker
+        self.max_size = max_size
+        self.linger = linger_ms / 1000
+        self.compression = compression
+        self._buffers: defaultdict[str, list[Any]] = defaultdict(list)
+        self._pending = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        await self.broker.connect()
+        self._closing.clear()
+        self._task = asyncio.create_task(self._flush_in_background())
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        self._closing.set()
+        self._pending.set()
+        await self._task
+        self._task = None
+        await self.flush()
+        await self.broker.stop()
+
+    async def publish(self, message: Any, topic: str) -> None:
+        if self._task is None:
+            raise RuntimeError("The publisher is not started.")
+
+        buffer = self._buffers[topic]
+        buffer.append(message)
+        if len(buffer) >= self.max_size:
+            await self.flush(topic)
+        else:
+            self._pending.set()
+
+    async def flush(self, topic: str | None = None) -> None:
+        topics = list(self._buffers) if topic is None else [topic]
+        batches = [
+            (name, self._buffers.pop(name))
+            for name in topics
+            if name in self._buffers
+        ]
+        await asyncio.gather(
+            *(self._send_or_log(name, messages) for name, messages in batches)
+        )
+
+    async def _flush_in_background(self) -> None:
+        while not self._closing.is_set():
+            await self._pending.wait()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._closing.wait(), self.linger)
+            self._pending.clear()
+            await self.flush()
+
+    async def _send_or_log(self, topic: str, messages: list[Any]) -> None:
+        try:
+            await self._send(topic, messages)
+        except Exception:
+            logger.exception(
+                "Could not publish %s messages to %s", len(messages), topic
+            )
+
+    async def _send(self, topic: str, messages: list[Any]) -> None:
+        raise NotImplementedError
+
+    async def _publish_concurrently(
+        self, topic: str, publishes: Iterable[Awaitable[Any]]
+    ) -> None:
+        # For brokers without a batch API, a failed message does not stop
+        # the others of the flush.
+        results = await asyncio.gather(*publishes, return_exceptions=True)
+        failed = [
+            result for result in results if isinstance(result, Exception)
+        ]
+        if failed:
+            logger.error(
+                "Could not publish %s messages to %s",
+                len(failed),
+                topic,
+                exc_info=failed[0],
+            )
+
+    def _encode(self, message: Any) -> tuple[Any, dict[str, str] | None]:
+        if self.compression is None:
+            return message, None
+
+        body, content_type = encode_message(message, None)
+        headers = {"content-encoding": "gzip"}
+        if content_type:
+            headers["x-content-type"] = content_type
+        return gzip.compress(body), headers
+
+
+async def decompress(msg: StreamMessage, original_decoder) -> Any:
+    """
+    Decoder of the subscribers that receive compressed messages:
+    `@broker.subscriber(..., decoder=decompress)`.
+    """
+    if msg.headers.get("content-encoding") == "gzip":
+        msg.body = gzip.decompress(msg.body)
+        msg.content_type = msg.headers.get("x-content-type")
+    return await original_decoder(msg)
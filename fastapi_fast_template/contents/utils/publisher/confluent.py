@@ -0,0 +1,27 @@
+from typing import Any
+
+from config import settings
+from faststream.confluent import KafkaBroker
+
+from utils.buffered_publisher import BufferedPublisher
+
+
+class KafkaPublisher(BufferedPublisher):
+    """
+    Publishes the buffered messages of a topic as one Kafka batch.
+    """
+
+    broker: KafkaBroker
+
+    async def _send(self, topic: str, messages: list[Any]) -> None:
+        await self.broker.publish_batch(*messages, topic=topic)
+
+
+publisher = KafkaPublisher(
+    KafkaBroker(
+        settings.broker_url,
+        compression_type=settings.publisher_compression,
+    ),
+    max_size=settings.publisher_max_size,
+    linger_ms=settings.publisher_linger_ms,
+)
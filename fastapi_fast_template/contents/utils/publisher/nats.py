@@ -0,0 +1,32 @@
+from typing import Any
+
+from config import settings
+from faststream.nats import NatsBroker
+
+from utils.buffered_publisher import BufferedPublisher
+
+
+class NatsPublisher(BufferedPublisher):
+    """
+    Publishes the buffered messages of a subject concurrently. The NATS
+    client writes them to the socket in as few writes as it can.
+    """
+
+    broker: NatsBroker
+
+    async def _send(self, subject: str, messages: list[Any]) -> None:
+        await self._publish_concurrently(
+            subject,
+            (
+                self.broker.publish(body, subject=subject, headers=headers)
+                for body, headers in map(self._encode, messages)
+            ),
+        )
+
+
+publisher = NatsPublisher(
+    NatsBroker(settings.broker_url),
+    max_size=settings.publisher_max_size,
+    linger_ms=settings.publisher_linger_ms,
+    compression=settings.publisher_compression,
+)
@@ -0,0 +1,33 @@
+from typing import Any
+
+from config import settings
+from faststream.rabbit import RabbitBroker
+
+from utils.buffered_publisher import BufferedPublisher
+
+
+class RabbitPublisher(BufferedPublisher):
+    """
+    Publishes the buffered messages of a queue concurrently over one channel.
+    RabbitMQ has no batch publishing, so this saves the round trips of the
+    request handlers rather than the ones to the broker.
+    """
+
+    broker: RabbitBroker
+
+    async def _send(self, queue: str, messages: list[Any]) -> None:
+        await self._publish_concurrently(
+            queue,
+            (
+                self.broker.publish(body, queue=queue, headers=headers)
+                for body, headers in map(self._encode, messages)
+            ),
+        )
+
+
+publisher = RabbitPublisher(
+    RabbitBroker(settings.broker_url),
+    max_size=settings.publisher_max_size,
+    linger_ms=settings.publisher_linger_ms,
+    compression=settings.publisher_compression,
+)
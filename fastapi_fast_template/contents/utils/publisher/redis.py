@@ -0,0 +1,35 @@
+from typing import Any
+
+from config import settings
+from faststream.redis import RedisBroker
+
+from utils.buffered_publisher import BufferedPublisher
+
+
+class RedisPublisher(BufferedPublisher):
+    """
+    Sends the buffered messages of a channel in one Redis pipeline.
+    """
+
+    broker: RedisBroker
+
+    async def _send(self, channel: str, messages: list[Any]) -> None:
+        connection = await self.broker.connect()
+        async with connection.pipeline() as pipeline:
+            for message in messages:
+                body, headers = self._encode(message)
+                await self.broker.publish(
+                    body,
+                    channel=channel,
+                    headers=headers,
+                    pipeline=pipeline,
+                )
+            await pipeline.execute()
+
+
+publisher = RedisPublisher(
+    RedisBroker(settings.broker_url),
+    max_size=settings.publisher_max_size,
+    linger_ms=settings.publisher_linger_ms,
+    compression=settings.publisher_compression,
+)
@@ -33,6 +33,8 @@ class DependencyEnum(EnumMixin, StrEnum):
     TORTOISE = "tortoise"
     SQLMODEL = "sqlmodel"
     BEANIE = "beanie"
+    TESTS = "tests"
+    BENCHMARKS = "benchmarks"
 
 
 class ODMEnum(EnumMixin, StrEnum):
@@ -61,6 +63,11 @@ class AuthEnum(EnumMixin, StrEnum):
     AUTHX = "auth"
 
 
+class YesNoEnum(EnumMixin, StrEnum):
+    YES = "yes"
+    NO = "no"
+
+
 class ArgumentDefaultValueEnum(StrEnum):
     APP_NAME = "Fast Template"
     CONFIG_TYPE = ConfigTypeEnum.MULTIPLE
@@ -69,11 +76,14 @@ class ArgumentDefaultValueEnum(StrEnum):
     LOGGING_TYPE = LoggingTypeEnum.INCOMING
     STREAM_BROKER = StreamBrokerEnum.REDIS
     AUTH = AuthEnum.AUTHX
+    BENCHMARKS = YesNoEnum.NO
 
 
 class DirectoryEnum(StrEnum):
     LOGS = "./logs"
     TESTS = "./tests"
+    BENCHMARKS = "./benchmarks"
+    BENCH_RESULTS = "./.bench"
     SRC = "./src"
     SRC_ROUTERS = "./src/routers"
     SRC_REPOSITORIES = "./src/repositories"
@@ -91,9 +101,15 @@ class FileEnum(StrEnum):
     ENV = ".env"
     PRE_COMMIT_CONFIG = ".pre-commit-config.yaml"
     RUFF_TOML = "ruff.toml"
+    PYTEST_INI = "pytest.ini"
 
     TESTS_CONFTEST = "tests/conftest.py"
 
+    BENCHMARKS_INIT_ = "benchmarks/__init__.py"
+    BENCHMARKS_CONFTEST = "benchmarks/conftest.py"
+    BENCHMARKS_PYTEST_INI = "benchmarks/pytest.ini"
+    BENCHMARKS_REPOSITORIES = "benchmarks/bench_repositories.py"
+
     SRC_CONFIG = "src/config.py"
     SRC_APP = "src/app.py"
     SRC_MAIN = "src/main.py"
@@ -101,9 +117,21 @@ class FileEnum(StrEnum):
     SRC_STREAM = "src/stream.py"
     SRC_REPO_BASE = "src/repositories/base.py"
     SRC_ROUTERS_INIT_ = "src/routers/__init__.py"
+    SRC_ROUTERS_DIAGNOSTICS = "src/routers/diagnostics.py"
     SRC_UTILS_LIFESPAN = "src/utils/lifespan.py"
     SRC_UTILS_CACHING = "src/utils/caching.py"
     SRC_UTILS_AUTHX = "src/utils/auth.py"
+    SRC_UTILS_LOOP_MONITOR = "src/utils/loop_monitor.py"
+    SRC_UTILS_ADMISSION = "src/utils/admission.py"
+    SRC_UTILS_COALESCING = "src/utils/coalescing.py"
+    SRC_UTILS_ETAG = "src/utils/etag.py"
+    SRC_UTILS_COMPRESSION = "src/utils/compression.py"
+    SRC_UTILS_HTTP = "src/utils/http.py"
+    SRC_UTILS_CIRCUIT_BREAKER = "src/utils/circuit_breaker.py"
+    SRC_UTILS_INDEXES = "src/utils/indexes.py"
+    SRC_UTILS_INDEX_USAGE = "src/utils/index_usage.py"
+    SRC_UTILS_BUFFERED_PUBLISHER = "src/utils/buffered_publisher.py"
+    SRC_UTILS_PUBLISHER = "src/utils/publisher.py"
     SRC_TASKS_INIT_ = "src/tasks/__init__.py"
 
     LAST_RUN_SCHEDULER = ".last_run_scheduler.txt"
@@ -112,6 +140,12 @@ class FileEnum(StrEnum):
 class ActionEnum(StrEnum):
     INIT = "init"
     EXTENSION = "extension"
+    DB = "db"
+    BENCH = "bench"
+
+
+class DbCommandEnum(EnumMixin, StrEnum):
+    INDEXES = "indexes"
 
 
 class ExtensionNameEnum(StrEnum):
@@ -121,3 +155,11 @@ class ExtensionNameEnum(StrEnum):
     LOGGING = "logging"
     STREAM = "stream"
     AUTH = "auth"
+    LOOP_MONITOR = "loop_monitor"
+    DIAGNOSTICS = "diagnostics"
+    ADMISSION = "admission"
+    COALESCING = "coalescing"
+    ETAG = "etag"
+    COMPRESSION = "compression"
+    HTTP = "http"
+    CIRCUIT_BREAKER = "circuit_breaker"
@@ -124,7 +124,7 @@ def add_text_to_obj_end(
                 and node.name == class_name
             ):
                 found = True
-                node.body.append(ast.parse(text_to_add).body[0])
+                node.body.extend(ast.parse(text_to_add).body)
                 node.body.append(empty_expr)
                 break
             elif (
@@ -133,7 +133,7 @@ def add_text_to_obj_end(
                 and node.name == function_name
             ):
                 found = True
-                node.body.append(ast.parse(text_to_add).body[0])
+                node.body.extend(ast.parse(text_to_add).body)
                 node.body.append(empty_expr)
                 break
             elif (
@@ -142,7 +142,7 @@ def add_text_to_obj_end(
                 and node.name == async_function_name
             ):
                 found = True
-                node.body.append(ast.parse(text_to_add).body[0])
+                node.body.extend(ast.parse(text_to_add).body)
                 node.body.append(empty_expr)
                 break
 